@@ -120,6 +120,7 @@ class GetHbarBalanceTool(BaseToolV2):
             human_message=post_process(hbar_balance, normalized_params.account_id),
             extra={
                 "balance": str(balance),
+                "balance_tinybars": int(balance),
                 "account_id": normalized_params.account_id,
             },
         )
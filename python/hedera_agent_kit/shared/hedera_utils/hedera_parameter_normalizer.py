@@ -715,6 +715,18 @@ class HederaParameterNormaliser:
             ),
         )
 
+        # Reject malformed addresses before any mirror node lookup or network call
+        for field_name in ("contract_id", "to_address"):
+            address = getattr(parsed_params, field_name, None)
+            if address and not (
+                AccountResolver.is_hedera_id(address)
+                or AccountResolver.is_evm_address(address)
+            ):
+                raise ValueError(
+                    f"Invalid {field_name}: {address}. Expected a Hedera ID (0.0.x) "
+                    f"or a 0x-prefixed EVM address."
+                )
+
         # Resolve recipient address (Hedera account ID or EVM) -> EVM address string
         to_address_input = getattr(parsed_params, "to_address", None)
         target_address = (
@@ -1,6 +1,10 @@
 import asyncio
+import copy
+import functools
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Optional, Any, Dict, List, Coroutine
+from typing import Optional, Any, Dict, List, Coroutine, Tuple
 
 import aiohttp
 
@@ -30,34 +34,120 @@ from .types import (
 )
 from .types.account import KeyType
 
+# Upper bound on the entries kept by a service's response cache
+_CACHE_MAX_SIZE = 1024
+
 
 class HederaMirrornodeServiceDefaultImpl(IHederaMirrornodeService):
-    def __init__(self, ledger_id: LedgerId):
+    def __init__(self, ledger_id: LedgerId, cache_ttl_seconds: float = 0):
+        """
+        Args:
+            ledger_id (LedgerId): Network whose mirror node should be queried.
+            cache_ttl_seconds (float): How long successful account/token/topic
+                lookups are served from this instance's cache. Disabled (0) by
+                default, since cached balances can be stale right after a
+                transaction. To enable it, pass a configured instance as
+                `Context.mirrornode_service`, so every tool shares it.
+        """
         if str(ledger_id.value) not in LedgerIdToBaseUrl:
             raise ValueError(f"Network type {ledger_id} not supported")
         self.base_url = LedgerIdToBaseUrl[ledger_id.value]
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._response_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Cacheable lookups currently in flight, keyed by request URL. Concurrent
+        # callers asking for the same URL await the same request.
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
+        # Pooled HTTP session, only open while the service is used as an async
+        # context manager; otherwise each request uses its own short-lived session
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "HederaMirrornodeServiceDefaultImpl":
+        """Open a pooled HTTP session reused by every request until exit.
+
+        Repeated queries then share keep-alive connections instead of paying a
+        new TCP/TLS handshake each. The session is bound to the running event
+        loop, so the service must only be used on that loop until it is closed.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session, if one is open."""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
 
     async def _fetch_json(self, url: str, context: Optional[str] = None) -> Any:
         """Fetch JSON with context-aware error messages."""
+        if self._session is not None and not self._session.closed:
+            return await self._get_json(self._session, url, context)
         async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    raise RuntimeError(
-                        f"Failed to fetch {context or 'data'}: HTTP {resp.status} - {text}"
-                    )
-                try:
-                    return await resp.json()
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Failed to parse JSON for {context or 'data'}: {str(e)}. Raw response: {text}"
-                    )
+            return await self._get_json(session, url, context)
+
+    @staticmethod
+    async def _get_json(
+        session: aiohttp.ClientSession, url: str, context: Optional[str]
+    ) -> Any:
+        async with session.get(url) as resp:
+            text = await resp.text()
+            if resp.status != 200:
+                raise RuntimeError(
+                    f"Failed to fetch {context or 'data'}: HTTP {resp.status} - {text}"
+                )
+            try:
+                return await resp.json()
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to parse JSON for {context or 'data'}: {str(e)}. Raw response: {text}"
+                )
+
+    async def _fetch_json_cached(self, url: str, context: Optional[str] = None) -> Any:
+        """Fetch JSON, serving repeated lookups of the same URL from a short-lived cache.
+
+        Concurrent lookups of the same URL share a single request. Errors are
+        never cached. Callers receive a copy, so mutating a response does not
+        affect the cached entry.
+        """
+        if self.cache_ttl_seconds <= 0:
+            return await self._fetch_json(url, context=context)
+
+        cached = self._response_cache.get(url)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+            return copy.deepcopy(cached[1])
+
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(url)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch_and_cache(url, context))
+            self._in_flight[url] = task
+            task.add_done_callback(functools.partial(self._forget_in_flight, url))
+        # Shield the shared request so one cancelled caller does not cancel it
+        # for everyone else waiting on it
+        data = await asyncio.shield(task)
+        return copy.deepcopy(data)
+
+    async def _fetch_and_cache(self, url: str, context: Optional[str]) -> Any:
+        data = await self._fetch_json(url, context=context)
+        self._response_cache[url] = (time.monotonic(), data)
+        self._response_cache.move_to_end(url)
+        while len(self._response_cache) > _CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
+        return data
+
+    def _forget_in_flight(self, url: str, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(url) is task:
+            del self._in_flight[url]
 
     # ------------------------- ACCOUNT ------------------------- #
 
     async def get_account(self, account_id: str) -> AccountResponse:
-        url = f"{self.base_url}/accounts/{account_id}"
-        raw_data: Dict[str, Any] = await self._fetch_json(
+        # Only account fields are read; skip the embedded transaction list
+        url = f"{self.base_url}/accounts/{account_id}?transactions=false"
+        raw_data: Dict[str, Any] = await self._fetch_json_cached(
             url, context=f"account {account_id}"
         )
 
@@ -95,7 +185,7 @@ class HederaMirrornodeServiceDefaultImpl(IHederaMirrornodeService):
     ) -> TokenBalancesResponse:
         token_param: str = f"&token.id={token_id}" if token_id else ""
         url: str = f"{self.base_url}/accounts/{account_id}/tokens?{token_param}"
-        res: TokenBalancesResponse = await self._fetch_json(
+        res: TokenBalancesResponse = await self._fetch_json_cached(
             url, context=f"token balances for account {account_id}"
         )
 
@@ -181,17 +271,17 @@ class HederaMirrornodeServiceDefaultImpl(IHederaMirrornodeService):
 
     async def get_topic_info(self, topic_id: str) -> TopicInfo:
         url: str = f"{self.base_url}/topics/{topic_id}"
-        return await self._fetch_json(url, context=f"topic info {topic_id}")
+        return await self._fetch_json_cached(url, context=f"topic info {topic_id}")
 
     # ------------------------- TOKEN ------------------------- #
 
     async def get_token_info(self, token_id: str) -> TokenInfo:
         url: str = f"{self.base_url}/tokens/{token_id}"
-        return await self._fetch_json(url, context=f"token info {token_id}")
+        return await self._fetch_json_cached(url, context=f"token info {token_id}")
 
     async def get_pending_airdrops(self, account_id: str) -> TokenAirdropsResponse:
         url: str = f"{self.base_url}/accounts/{account_id}/airdrops/pending"
-        return await self._fetch_json(
+        return await self._fetch_json_cached(
             url, context=f"pending airdrops for account {account_id}"
         )
 
@@ -1,3 +1,5 @@
+import re
+
 from hiero_sdk_python import Client, PublicKey
 
 from hedera_agent_kit.shared.configuration import Context, AgentMode
@@ -8,6 +10,9 @@ from hedera_agent_kit.shared.hedera_utils.mirrornode.hedera_mirrornode_service_i
 from hedera_agent_kit.shared.hedera_utils.mirrornode.types.account import KeyType
 from hedera_agent_kit.shared.utils import ledger_id_from_network
 
+EVM_ADDRESS_PATTERN = re.compile(r"^0x[0-9a-fA-F]{40}$")
+HEDERA_ID_PATTERN = re.compile(r"^\d+\.\d+\.\d+$")
+
 
 class AccountResolver:
     """
@@ -92,6 +97,20 @@ class AccountResolver:
         """
         return address.startswith("0.") or address.startswith("0.0.")
 
+    @staticmethod
+    def is_hedera_id(address: str) -> bool:
+        """
+        Checks if the given address is a well-formed Hedera entity ID (shard.realm.num).
+        """
+        return HEDERA_ID_PATTERN.match(address) is not None
+
+    @staticmethod
+    def is_evm_address(address: str) -> bool:
+        """
+        Checks if the given address is a well-formed EVM address (0x followed by 40 hex digits).
+        """
+        return EVM_ADDRESS_PATTERN.match(address) is not None
+
     @staticmethod
     async def get_hedera_evm_address(
         address: str, mirror_node: IHederaMirrornodeService
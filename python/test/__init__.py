@@ -3,6 +3,7 @@ from .utils import (
     HederaOperationsWrapper,
     create_langchain_test_setup,
     wait,
+    poll_until_visible,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "HederaOperationsWrapper",
     "create_langchain_test_setup",
     "wait",
+    "poll_until_visible",
 ]
@@ -56,6 +56,20 @@ def slow_down_tests():
 # =============================================================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def close_clients_at_session_end():
+    """
+    Closes every client created during the session in a single parallel batch.
+
+    Fixtures no longer need to close their clients one by one at teardown;
+    all clients registered by `get_custom_client` are shut down here instead.
+    """
+    yield
+    from test.utils.setup import close_live_clients
+
+    asyncio.run(close_live_clients())
+
+
 @pytest.fixture(scope="session")
 def operator_client():
     """
@@ -65,14 +79,44 @@ def operator_client():
     The operator account (from env variables) is used to fund executor accounts
     which perform the actual test operations.
 
-    Yields:
+    When running under pytest-xdist with `TEST_WORKER_OPERATOR_HBAR` set, each
+    worker gets its own operator sub-account funded with that many HBAR from the
+    main operator, so workers do not share a payer account. The sub-account is
+    deleted at session end and its remaining balance returned.
+
+    Tests that need the network are skipped when the operator credentials
+    (`ACCOUNT_ID` / `PRIVATE_KEY`) are not configured, instead of erroring.
+
+    Returns:
         Client: A configured Hedera testnet client using operator credentials.
     """
-    from test.utils.setup import get_operator_client_for_tests
+    from hiero_sdk_python import Hbar
+
+    from test.utils.setup import (
+        delete_worker_operator,
+        get_operator_client_for_tests,
+        get_worker_operator_client,
+        is_operator_configured,
+    )
+
+    if not is_operator_configured():
+        pytest.skip("Hedera operator credentials (ACCOUNT_ID / PRIVATE_KEY) not set")
+
+    # Clients are closed by `close_clients_at_session_end` together with all others
+    main_operator_client = get_operator_client_for_tests()
+
+    worker_budget = os.getenv("TEST_WORKER_OPERATOR_HBAR")
+    if not worker_budget or not os.getenv("PYTEST_XDIST_WORKER", "").startswith("gw"):
+        yield main_operator_client
+        return
 
-    client = get_operator_client_for_tests()
-    yield client
-    client.close()
+    worker_client = get_worker_operator_client(
+        main_operator_client, Hbar(float(worker_budget))
+    )
+    yield worker_client
+    asyncio.run(
+        delete_worker_operator(worker_client, main_operator_client.operator_account_id)
+    )
 
 
 @pytest.fixture(scope="session")
@@ -91,3 +135,125 @@ def operator_wrapper(operator_client):
     from test import HederaOperationsWrapper
 
     return HederaOperationsWrapper(operator_client)
+
+
+@pytest.fixture(scope="session")
+def key_pool():
+    """
+    Session-level pool of pre-generated ED25519 and ECDSA keys.
+
+    Fixtures call `key_pool.take()` / `key_pool.take_ecdsa()` instead of
+    generating keys themselves, so key generation is paid once up front rather
+    than inside each setup.
+
+    Returns:
+        KeyPool: A pool handing out each key at most once.
+    """
+    from test.utils.setup import KeyPool
+
+    return KeyPool()
+
+
+@pytest.fixture(scope="session")
+async def executor_account_pool(operator_client, operator_wrapper, key_pool):
+    """
+    Session-level pool of funded executor accounts.
+
+    The accounts are created concurrently once at session start and handed out
+    with `await executor_account_pool.acquire()`, so module setup does not
+    spend its own AccountCreate round trip on an executor. Every pooled account
+    is deleted at session end and its HBAR returned to the operator.
+
+    Yields:
+        ExecutorAccountPool: The filled pool.
+    """
+    from hiero_sdk_python import Hbar
+
+    from test.utils.setup import ExecutorAccountPool
+    from test.utils.setup.langchain_test_config import BALANCE_TIERS
+
+    pool = ExecutorAccountPool(
+        operator_wrapper,
+        key_pool,
+        Hbar(UsdToHbarService.usd_to_hbar(BALANCE_TIERS["ELEVATED"])),
+    )
+    await pool.fill()
+
+    yield pool
+
+    await pool.close(operator_client.operator_account_id)
+
+
+@pytest.fixture(scope="session")
+async def executor_account(executor_account_pool):
+    """
+    Session-level executor account shared by test modules.
+
+    Modules that only need a funded account to run tools from depend on this
+    fixture instead of creating (and deleting) their own executor, and only set
+    up their feature-specific entities (tokens, topics, airdrops).
+
+    Returns:
+        dict: `executor_client`, `executor_wrapper`, `executor_account_id`,
+        `executor_public_key` (derived once so fixtures do not repeat the
+        curve operation) and an AUTONOMOUS `context` bound to the executor account.
+    """
+    # Deleted by `executor_account_pool` at session end
+    return await executor_account_pool.acquire()
+
+
+@pytest.fixture(scope="session")
+async def executor_and_recipient_accounts(
+    operator_client, operator_wrapper, executor_account, key_pool
+):
+    """
+    Session-level executor and recipient pair for scheduled transfer tests.
+
+    The executor is the shared `executor_account`; the recipient is one extra
+    account created for the underlying transfers in scheduled transactions.
+    Both schedule test modules use this pair instead of each creating and
+    deleting two accounts of their own.
+
+    Returns:
+        dict: `operator_client`, `operator_wrapper`, `executor_client`,
+        `executor_wrapper`, `executor_account_id`, `recipient_account_id` and
+        an AUTONOMOUS `context` bound to the executor account.
+    """
+    from hiero_sdk_python import Hbar
+
+    from hedera_agent_kit.shared.parameter_schemas import (
+        CreateAccountParametersNormalised,
+    )
+    from test import HederaOperationsWrapper
+    from test.utils.setup import get_custom_client
+    from test.utils.setup.langchain_test_config import BALANCE_TIERS
+    from test.utils.teardown import return_hbars_and_delete_account
+
+    recipient_key_pair = key_pool.take()
+    recipient_resp = await operator_wrapper.create_account(
+        CreateAccountParametersNormalised(
+            initial_balance=Hbar(
+                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
+            ),
+            key=recipient_key_pair.public_key(),
+        )
+    )
+    recipient_account_id = recipient_resp.account_id
+
+    yield {
+        "operator_client": operator_client,
+        "operator_wrapper": operator_wrapper,
+        "executor_client": executor_account["executor_client"],
+        "executor_wrapper": executor_account["executor_wrapper"],
+        "executor_account_id": executor_account["executor_account_id"],
+        "recipient_account_id": recipient_account_id,
+        "context": executor_account["context"],
+    }
+
+    # The recipient can only be emptied and deleted with its own key
+    recipient_client = get_custom_client(recipient_account_id, recipient_key_pair)
+    await return_hbars_and_delete_account(
+        HederaOperationsWrapper(recipient_client),
+        recipient_account_id,
+        operator_client.operator_account_id,
+    )
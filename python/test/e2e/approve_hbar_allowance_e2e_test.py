@@ -224,7 +224,7 @@ async def test_should_approve_hbar_allowance_and_allow_spender_to_use_part_of_it
     spend_amount = 1.01
     memo = "E2E approve allowance memo"
 
-    balance_before = spender_wrapper.get_account_hbar_balance(str(spender_id))
+    balance_before = await spender_wrapper.get_account_hbar_balance(str(spender_id))
 
     # 1. Agent approves allowance
     input_text = (
@@ -273,7 +273,7 @@ async def test_should_approve_and_spend_very_small_amount_via_allowance(
     allowance_amount = 0.11
     spend_amount = 0.1
 
-    balance_before = spender_wrapper.get_account_hbar_balance(str(spender_id))
+    balance_before = await spender_wrapper.get_account_hbar_balance(str(spender_id))
 
     # 1. Agent approves allowance
     input_text = f"Approve {allowance_amount} HBAR allowance to {spender_id}"
@@ -196,7 +196,7 @@ async def test_create_account_with_initial_balance_and_memo(
     info = executor_wrapper.get_account_info(new_account_id)
     assert info.account_memo == "E2E test account"
 
-    balance = executor_wrapper.get_account_hbar_balance(new_account_id)
+    balance = await executor_wrapper.get_account_hbar_balance(new_account_id)
     assert balance >= int(0.05 * 1e8)
 
     # Cleanup created an account
@@ -271,7 +271,7 @@ async def test_create_account_with_very_small_initial_balance(
     result = await execute_create_account(agent_executor, input_text, langchain_config)
     new_account_id = extract_account_id(result, response_parser, "create_account_tool")
 
-    balance = executor_wrapper.get_account_hbar_balance(new_account_id)
+    balance = await executor_wrapper.get_account_hbar_balance(new_account_id)
     assert balance >= int(0.0001 * 1e8)
 
     # Cleanup created an account
@@ -174,7 +174,7 @@ async def test_create_fungible_token_minimal_params(
     )
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "MyToken"
     assert token_info.symbol == "MTK"
     assert token_info.decimals == 0
@@ -199,7 +199,7 @@ async def test_create_fungible_token_complex_params(
     )
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "GoldCoin"
     assert token_info.symbol == "GLD"
     assert token_info.decimals == 2
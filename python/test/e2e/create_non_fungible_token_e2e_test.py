@@ -161,7 +161,7 @@ async def test_create_nft_minimal_params(
     )
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "MyNFT"
     assert token_info.symbol == "MNFT"
     assert token_info.token_type == TokenType.NON_FUNGIBLE_UNIQUE
@@ -189,7 +189,7 @@ async def test_create_nft_with_max_supply(
     )
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "ArtCollection"
     assert token_info.symbol == "ART"
     assert token_info.max_supply == 500
@@ -214,7 +214,7 @@ async def test_create_nft_with_explicit_finite_supply(
     )
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "LimitedEdition"
     assert token_info.symbol == "LTD"
     assert token_info.supply_type == SupplyType.FINITE
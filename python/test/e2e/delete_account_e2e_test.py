@@ -241,7 +241,7 @@ async def test_delete_account_with_natural_language_variations(
     )
     target_account_id = str(resp.account_id)
 
-    operator_balance_before = executor_wrapper.get_account_hbar_balance(
+    operator_balance_before = await executor_wrapper.get_account_hbar_balance(
         str(executor_client.operator_account_id)
     )
 
@@ -264,7 +264,7 @@ async def test_delete_account_with_natural_language_variations(
 
     await wait(MIRROR_NODE_WAITING_TIME)
 
-    operator_balance_after = executor_wrapper.get_account_hbar_balance(
+    operator_balance_after = await executor_wrapper.get_account_hbar_balance(
         str(executor_client.operator_account_id)
     )
 
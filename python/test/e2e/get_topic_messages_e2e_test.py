@@ -17,7 +17,6 @@ from hedera_agent_kit.shared.parameter_schemas import (
 )
 from test import HederaOperationsWrapper, create_langchain_test_setup, wait
 from test.utils.setup import (
-    get_operator_client_for_tests,
     get_custom_client,
     MIRROR_NODE_WAITING_TIME,
 )
@@ -25,21 +24,10 @@ from test.utils.teardown import return_hbars_and_delete_account
 from test.utils.usd_to_hbar_service import UsdToHbarService
 
 
-@pytest.fixture(scope="session")
-def operator_client():
-    """Initialize operator client for test session."""
-    return get_operator_client_for_tests()
-
-
-@pytest.fixture(scope="session")
-def operator_wrapper(operator_client):
-    """Provide a HederaOperationsWrapper for the operator."""
-    return HederaOperationsWrapper(operator_client)
-
-
 @pytest.fixture
 async def executor_account(operator_wrapper, operator_client):
     """Create a funded executor account and yield its client + wrapper."""
+    # operator_client and operator_wrapper are provided by conftest.py (session scope)
     executor_key = PrivateKey.generate_ed25519()
     executor_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
@@ -195,11 +195,9 @@ async def test_mint_erc721_to_evm_address_via_natural_language(setup_environment
 
     # Resolve EVM address for the recipient
     executor_wrapper = env["executor_wrapper"]
-    recipient_info = await executor_wrapper.get_account_info_mirrornode(
+    recipient_evm = await executor_wrapper.get_account_evm_address(
         str(recipient_account_id)
     )
-    recipient_evm = recipient_info.get("evm_address")
-    assert recipient_evm, "Recipient EVM address not found"
 
     input_text = f"Mint ERC721 token {erc721_address} to {recipient_evm}"
     result = await execute_agent_request(agent_executor, input_text, config)
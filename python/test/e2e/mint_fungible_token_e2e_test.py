@@ -160,7 +160,7 @@ async def test_mint_additional_supply(setup_environment):
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Get supply before
-    info_before = executor_wrapper.get_token_info(token_id_str)
+    info_before = await executor_wrapper.get_token_info(token_id_str)
     supply_before = info_before.total_supply
 
     # 2. Execute
@@ -183,7 +183,7 @@ async def test_mint_additional_supply(setup_environment):
     # 4. Verify On-Chain
     await wait(MIRROR_NODE_WAITING_TIME)
 
-    info_after = executor_wrapper.get_token_info(token_id_str)
+    info_after = await executor_wrapper.get_token_info(token_id_str)
     supply_after = info_after.total_supply
 
     # Expected: 5 * 10^2 = 500 additional units
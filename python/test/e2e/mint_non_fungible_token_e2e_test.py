@@ -161,7 +161,7 @@ async def test_mint_single_nft(setup_environment):
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Get supply before
-    info_before = executor_wrapper.get_token_info(token_id_str)
+    info_before = await executor_wrapper.get_token_info(token_id_str)
     supply_before = info_before.total_supply
 
     # 2. Execute
@@ -182,7 +182,7 @@ async def test_mint_single_nft(setup_environment):
     # 4. Verify On-Chain
     await wait(MIRROR_NODE_WAITING_TIME)
 
-    info_after = executor_wrapper.get_token_info(token_id_str)
+    info_after = await executor_wrapper.get_token_info(token_id_str)
     supply_after = info_after.total_supply
 
     assert supply_after == supply_before + 1
@@ -204,7 +204,7 @@ async def test_mint_multiple_nfts(setup_environment):
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Get supply before
-    info_before = executor_wrapper.get_token_info(token_id_str)
+    info_before = await executor_wrapper.get_token_info(token_id_str)
     supply_before = info_before.total_supply
 
     uris = ["ipfs://meta2.json", "ipfs://meta3.json", "ipfs://meta4.json"]
@@ -229,7 +229,7 @@ async def test_mint_multiple_nfts(setup_environment):
     # 4. Verify On-Chain
     await wait(MIRROR_NODE_WAITING_TIME)
 
-    info_after = executor_wrapper.get_token_info(token_id_str)
+    info_after = await executor_wrapper.get_token_info(token_id_str)
     supply_after = info_after.total_supply
 
     assert supply_after == supply_before + len(uris)
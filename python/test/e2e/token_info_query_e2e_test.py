@@ -115,8 +115,6 @@ async def setup_environment(operator_client, operator_wrapper):
     )
     token_executor_client.close()
 
-    operator_client.close()
-
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -5,8 +5,10 @@ This module provides full testing from user-simulated input, through the LLM,
 tools up to on-chain execution.
 """
 
-import pytest
+import asyncio
 from typing import Any
+
+import pytest
 from hiero_sdk_python import Hbar, PrivateKey
 
 from test.utils.usd_to_hbar_service import UsdToHbarService
@@ -18,12 +20,9 @@ from hedera_agent_kit.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
     CreateERC20Parameters,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils import create_langchain_test_setup
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test import HederaOperationsWrapper
+from test.utils import create_langchain_test_setup, poll_until_visible
+from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 # ============================================================================
@@ -65,8 +64,6 @@ async def setup_environment(operator_client, operator_wrapper):
     lc_setup = await create_langchain_test_setup(custom_client=executor_client)
     langchain_config = RunnableConfig(configurable={"thread_id": "transfer_erc20_e2e"})
 
-    await wait(MIRROR_NODE_WAITING_TIME)
-
     # Create test ERC20 token with initial supply
     create_params = CreateERC20Parameters(
         token_name="TestTransferToken",
@@ -81,7 +78,17 @@ async def setup_environment(operator_client, operator_wrapper):
         raise Exception("Failed to create test ERC20 token for transfers")
 
     test_token_address = create_result["erc20_address"]
-    await wait(MIRROR_NODE_WAITING_TIME)
+
+    # The tool resolves the contract and the recipient through the mirror node,
+    # so poll until both are ingested instead of sleeping a fixed time
+    async def setup_visible() -> bool:
+        await asyncio.gather(
+            executor_wrapper.mirrornode.get_contract_info(test_token_address),
+            executor_wrapper.get_account_info_mirrornode(str(recipient_account_id)),
+        )
+        return True
+
+    await poll_until_visible(setup_visible)
 
     yield {
         "operator_client": operator_client,
@@ -155,8 +162,8 @@ async def test_transfer_erc20_via_natural_language(setup_environment):
     assert parsed_data["raw"]["status"] == "SUCCESS"
     assert parsed_data["raw"]["transaction_id"] is not None
 
-    await wait(MIRROR_NODE_WAITING_TIME)
-
+    # balanceOf is a contract call query answered by a consensus node, so it sees
+    # the transfer as soon as the receipt is returned; no mirror node wait
     # Verify the balance after transfer
     executor_wrapper = env["executor_wrapper"]
     recipient_balance = await executor_wrapper.get_erc20_balance(
@@ -204,8 +211,8 @@ async def test_handle_various_natural_language_variations(setup_environment):
         amount_str = input_text.split()[1]
         total_transferred += int(amount_str)
 
-    await wait(MIRROR_NODE_WAITING_TIME)
-
+    # balanceOf is a contract call query answered by a consensus node, so it sees
+    # the transfer as soon as the receipt is returned; no mirror node wait
     # Verify the cumulative balance after all transfers in THIS test only
     recipient_balance = await executor_wrapper.get_erc20_balance(
         test_token_address, str(recipient_account_id)
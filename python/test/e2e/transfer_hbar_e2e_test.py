@@ -203,7 +203,9 @@ async def test_simple_transfer(
 ):
     """Test a basic HBAR transfer without memo."""
     amount = Decimal("0.1")
-    balance_before = executor_wrapper.get_account_hbar_balance(str(recipient_account))
+    balance_before = await executor_wrapper.get_account_hbar_balance(
+        str(recipient_account)
+    )
 
     input_text = f"Transfer {amount} HBAR to {recipient_account}"
     parsed_data = await execute_transfer(
@@ -213,7 +215,9 @@ async def test_simple_transfer(
     assert parsed_data.get("error") is None
     assert "hbar successfully transferred" in parsed_data["humanMessage"].lower()
 
-    balance_after = executor_wrapper.get_account_hbar_balance(str(recipient_account))
+    balance_after = await executor_wrapper.get_account_hbar_balance(
+        str(recipient_account)
+    )
     assert_balance_changed(balance_before, balance_after, amount)
 
 
@@ -228,7 +232,9 @@ async def test_transfer_with_memo(
     """Test HBAR transfer with a memo field."""
     amount = Decimal("0.05")
     memo = "Payment for services"
-    balance_before = executor_wrapper.get_account_hbar_balance(str(recipient_account))
+    balance_before = await executor_wrapper.get_account_hbar_balance(
+        str(recipient_account)
+    )
 
     input_text = f'Transfer {amount} HBAR to {recipient_account} with memo "{memo}"'
     parsed_data = await execute_transfer(
@@ -238,7 +244,9 @@ async def test_transfer_with_memo(
     assert parsed_data.get("error") is None
     assert "hbar successfully transferred" in parsed_data["humanMessage"].lower()
 
-    balance_after = executor_wrapper.get_account_hbar_balance(str(recipient_account))
+    balance_after = await executor_wrapper.get_account_hbar_balance(
+        str(recipient_account)
+    )
     assert_balance_changed(balance_before, balance_after, amount)
 
 
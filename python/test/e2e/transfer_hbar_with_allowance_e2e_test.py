@@ -4,6 +4,7 @@ This module provides full testing from user-simulated input, through the LLM,
 tools up to on-chain execution.
 """
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -242,7 +243,7 @@ async def test_transfer_hbar_using_allowance(
     await approve_allowance(owner_wrapper, spender_id, 5.0)
 
     # 3. Capture balance before
-    balance_before = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_before = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
 
     # 4. Agent Execution (Spender executes)
     input_text = f"Transfer {transfer_amount} HBAR from {owner_id} to {receiver_id} using allowance"
@@ -256,7 +257,7 @@ async def test_transfer_hbar_using_allowance(
     assert tool_call.parsedData["raw"]["status"] == "SUCCESS"
 
     # 6. Verification - On-Chain Balance
-    balance_after = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_after = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
     expected_increase = int(Hbar(transfer_amount).to_tinybars())
 
     assert balance_after == balance_before + expected_increase
@@ -281,7 +282,7 @@ async def test_transfer_hbar_allowance_with_memo(
 
     await approve_allowance(owner_wrapper, spender_id, 5.0)
 
-    balance_before = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_before = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
 
     input_text = (
         f"Spend allowance from {owner_id} to send {transfer_amount} HBAR "
@@ -294,7 +295,7 @@ async def test_transfer_hbar_allowance_with_memo(
     assert tool_call is not None
     assert "successfully transferred" in tool_call.parsedData["humanMessage"]
 
-    balance_after = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_after = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
     expected_increase = int(Hbar(transfer_amount).to_tinybars())
 
     assert balance_after == balance_before + expected_increase
@@ -319,7 +320,7 @@ async def test_transfer_hbar_allowance_tiny_amount(
 
     await approve_allowance(owner_wrapper, spender_id, 1.0)
 
-    balance_before = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_before = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
 
     input_text = f"Transfer {transfer_amount:.8f} HBAR from {owner_id} to {receiver_id} using allowance"
 
@@ -329,7 +330,7 @@ async def test_transfer_hbar_allowance_tiny_amount(
     assert tool_call is not None
     assert "successfully transferred" in tool_call.parsedData["humanMessage"]
 
-    balance_after = owner_wrapper.get_account_hbar_balance(str(receiver_id))
+    balance_after = await owner_wrapper.get_account_hbar_balance(str(receiver_id))
     # 1 tinybar
     assert balance_after == balance_before + 1
 
@@ -366,8 +367,10 @@ async def test_transfer_hbar_allowance_multiple_recipients(
     amount1 = 0.05
     amount2 = 0.05
 
-    bal1_before = owner_wrapper.get_account_hbar_balance(str(receiver1_id))
-    bal2_before = owner_wrapper.get_account_hbar_balance(str(receiver2_id))
+    bal1_before, bal2_before = await asyncio.gather(
+        owner_wrapper.get_account_hbar_balance(str(receiver1_id)),
+        owner_wrapper.get_account_hbar_balance(str(receiver2_id)),
+    )
 
     input_text = (
         f"Use allowance from {owner_id} to send {amount1} HBAR to {receiver1_id} "
@@ -380,8 +383,10 @@ async def test_transfer_hbar_allowance_multiple_recipients(
     assert tool_call is not None
     assert "successfully transferred" in tool_call.parsedData["humanMessage"]
 
-    bal1_after = owner_wrapper.get_account_hbar_balance(str(receiver1_id))
-    bal2_after = owner_wrapper.get_account_hbar_balance(str(receiver2_id))
+    bal1_after, bal2_after = await asyncio.gather(
+        owner_wrapper.get_account_hbar_balance(str(receiver1_id)),
+        owner_wrapper.get_account_hbar_balance(str(receiver2_id)),
+    )
 
     expected_increase = int(Hbar(amount1).to_tinybars())
 
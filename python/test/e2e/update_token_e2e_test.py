@@ -211,7 +211,7 @@ async def test_update_token_name_e2e(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "AgentUpdatedName"
 
 
@@ -238,7 +238,7 @@ async def test_update_token_symbol_e2e(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.symbol == "AGSYM"
 
 
@@ -265,7 +265,7 @@ async def test_update_token_memo_e2e(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.memo == "E2E updated memo"
 
 
@@ -292,7 +292,7 @@ async def test_update_token_supply_key_with_my_key(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain - supply key should be the executor's key
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert str(token_info.supply_key.to_string()) == str(
         executor_client.operator_private_key.public_key().to_string()
     )
@@ -327,7 +327,7 @@ async def test_update_token_supply_key_with_explicit_key(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.supply_key.to_string() == new_supply_key.to_string()
 
 
@@ -479,7 +479,7 @@ async def test_update_multiple_fields_at_once(
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Verify on-chain
-    token_info = executor_wrapper.get_token_info(token_id_str)
+    token_info = await executor_wrapper.get_token_info(token_id_str)
     assert token_info.name == "MultiUpdated"
     assert token_info.symbol == "MULT"
     assert token_info.memo == "Combined update"
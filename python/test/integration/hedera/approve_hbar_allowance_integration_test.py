@@ -95,8 +95,6 @@ async def setup_accounts(operator_client, operator_wrapper):
     )
     spender_client.close()
 
-    operator_client.close()
-
 
 @pytest.mark.asyncio
 async def test_approves_allowance_with_explicit_owner_and_memo(setup_accounts):
@@ -127,7 +127,7 @@ async def test_create_account_with_initial_balance_and_memo(setup_accounts):
     new_account_id = str(exec_result.raw.account_id)
 
     # Verify balance
-    balance = executor_wrapper.get_account_hbar_balance(new_account_id)
+    balance = await executor_wrapper.get_account_hbar_balance(new_account_id)
     assert balance >= int(0.05 * 1e8)  # tinybars
 
     # Verify memo
@@ -53,7 +53,7 @@ async def test_create_token_with_minimal_params(setup_client):
     assert exec_result.raw.token_id is not None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == params.token_name
     assert token_info.symbol == params.token_symbol
@@ -84,7 +84,7 @@ async def test_create_token_with_supply_decimals_and_finite_type(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == params.token_name
     assert token_info.decimals == params.decimals
@@ -118,7 +118,7 @@ async def test_create_token_with_treasury_account_and_supply_key(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert "Token created successfully" in result.human_message
     assert str(token_info.treasury) == params.treasury_account_id
@@ -48,7 +48,7 @@ async def test_create_nft_with_minimal_params(setup_client):
     assert exec_result.raw.token_id is not None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == params.token_name
     assert token_info.symbol == params.token_symbol
@@ -77,7 +77,7 @@ async def test_create_nft_explicit_infinite_supply(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == "InfiniteNFT"
     assert token_info.supply_type == SupplyType.INFINITE
@@ -100,7 +100,7 @@ async def test_create_nft_with_max_supply(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == params.token_name
     assert token_info.supply_type == SupplyType.FINITE
@@ -126,7 +126,7 @@ async def test_create_nft_with_explicit_finite_supply_type(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert token_info.name == "ExplicitFiniteNFT"
     assert token_info.symbol == "EFNFT"
@@ -151,7 +151,7 @@ async def test_create_nft_with_treasury_account(setup_client):
     assert result.error is None
     token_id_str = str(exec_result.raw.token_id)
 
-    token_info = hedera_operations_wrapper.get_token_info(token_id_str)
+    token_info = await hedera_operations_wrapper.get_token_info(token_id_str)
 
     assert str(token_info.treasury) == params.treasury_account_id
     # Supply key should be the operator's public key (default behavior when treasury is operator)
@@ -123,7 +123,6 @@ async def setup_accounts(operator_client, operator_wrapper):
 
     executor_client.close()
     spender_client.close()
-    operator_client.close()
 
 
 @pytest.mark.asyncio
@@ -1,7 +1,7 @@
-from typing import cast
+import logging
 
 import pytest
-from hiero_sdk_python import Client, PrivateKey, Hbar
+from hiero_sdk_python import Client, Hbar
 
 from test.utils.usd_to_hbar_service import UsdToHbarService
 from test.utils.setup.langchain_test_config import BALANCE_TIERS
@@ -10,7 +10,6 @@ from hedera_agent_kit.plugins.core_consensus_plugin import DeleteTopicTool
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -21,18 +20,22 @@ from hedera_agent_kit.shared.parameter_schemas import (
 from test import HederaOperationsWrapper
 from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_EXECUTOR_BALANCE = Hbar(UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"]))
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
+async def setup_accounts(operator_client, operator_wrapper, key_pool):
     # operator_client and operator_wrapper are provided by conftest.py (session scope)
 
-    executor_key_pair = PrivateKey.generate_ed25519()
+    executor_key_pair = key_pool.take()
     executor_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
+            initial_balance=DEFAULT_EXECUTOR_BALANCE,
             key=executor_key_pair.public_key(),
         )
     )
@@ -53,7 +56,15 @@ async def setup_accounts(operator_client, operator_wrapper):
     await return_hbars_and_delete_account(
         executor_wrapper, executor_account_id, operator_client.operator_account_id
     )
-    executor_client.close()
+
+
+@pytest.fixture(scope="module")
+def operator_context(operator_client) -> Context:
+    # The failure-path tests never reach a created topic, so they run as the
+    # operator and do not wait for the executor account to be created.
+    return Context(
+        mode=AgentMode.AUTONOMOUS, account_id=str(operator_client.operator_account_id)
+    )
 
 
 async def create_temp_topic(
@@ -74,39 +85,37 @@ async def test_delete_topic_successfully(setup_accounts):
 
     topic_id = await create_temp_topic(executor_wrapper, executor_client)
     assert topic_id is not None
-    print(f"Created topic {str(topic_id)}")
+    logger.debug("Created topic %s", topic_id)
 
     tool = DeleteTopicTool(context)
     params = DeleteTopicParameters(topic_id=str(topic_id))
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    assert_executed(result)
 
     assert "Topic with id" in result.human_message
-    assert exec_result.raw.transaction_id is not None
-    assert exec_result.raw.status == "SUCCESS"
+    assert result.raw.transaction_id is not None
+    assert result.raw.status == "SUCCESS"
 
 
 @pytest.mark.asyncio
-async def test_delete_invalid_topic_id_should_fail(setup_accounts):
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
+async def test_delete_invalid_topic_id_should_fail(operator_client, operator_context):
+    context: Context = operator_context
 
     tool = DeleteTopicTool(context)
     params = DeleteTopicParameters(topic_id="invalid-topic")
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await tool.execute(operator_client, context, params)
 
     assert "Failed to delete the topic" in result.human_message
     assert result.error is not None
 
 
 @pytest.mark.asyncio
-async def test_delete_nonexistent_topic_should_fail(setup_accounts):
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
+async def test_delete_nonexistent_topic_should_fail(operator_client, operator_context):
+    context: Context = operator_context
 
     tool = DeleteTopicTool(context)
     params = DeleteTopicParameters(topic_id="0.0.999999999")
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await tool.execute(operator_client, context, params)
 
     assert "INVALID_TOPIC_ID" in result.human_message or result.error is not None
     assert result.error is not None
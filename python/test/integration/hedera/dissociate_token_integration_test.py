@@ -1,9 +1,9 @@
-from typing import cast, List
+import asyncio
+from typing import List
 
 import pytest
 from hiero_sdk_python import (
     Client,
-    PrivateKey,
     Hbar,
     TokenId,
     SupplyType,
@@ -17,7 +17,6 @@ from hedera_agent_kit.plugins.core_token_plugin import DissociateTokenTool
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -31,20 +30,23 @@ from test.utils.setup import (
     MIRROR_NODE_WAITING_TIME,
 )
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
-async def setup_environment(operator_client, operator_wrapper):
+async def setup_environment(operator_client, operator_wrapper, key_pool):
     # operator_client and operator_wrapper are provided by conftest.py (session scope)
 
+    # Converted here rather than at import time, so collecting the module does
+    # not fail when the USD rate could not be fetched
+    default_balance = Hbar(UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"]))
+
     # 1. Create Executor Account (The one associating/dissociating)
-    executor_key = PrivateKey.generate_ed25519()
+    executor_key = key_pool.take()
     executor_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
             key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
+            initial_balance=default_balance,
         )
     )
     executor_account_id = executor_resp.account_id
@@ -52,13 +54,11 @@ async def setup_environment(operator_client, operator_wrapper):
     executor_wrapper = HederaOperationsWrapper(executor_client)
 
     # 2. Create Token Creator Account (Treasury)
-    token_creator_key = PrivateKey.generate_ed25519()
+    token_creator_key = key_pool.take()
     token_creator_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
             key=token_creator_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
+            initial_balance=default_balance,
         )
     )
     token_creator_account_id = token_creator_resp.account_id
@@ -130,20 +130,19 @@ async def setup_environment(operator_client, operator_wrapper):
         "token_id_nft": token_id_nft,
     }
 
-    # Teardown
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        executor_account_id,
-        operator_client.operator_account_id,
-    )
-    executor_client.close()
-
-    await return_hbars_and_delete_account(
-        token_creator_wrapper,
-        token_creator_account_id,
-        operator_client.operator_account_id,
+    # Teardown: both accounts are independent, so return their HBARs concurrently
+    await asyncio.gather(
+        return_hbars_and_delete_account(
+            executor_wrapper,
+            executor_account_id,
+            operator_client.operator_account_id,
+        ),
+        return_hbars_and_delete_account(
+            token_creator_wrapper,
+            token_creator_account_id,
+            operator_client.operator_account_id,
+        ),
     )
-    token_creator_client.close()
 
 
 async def associate_tokens(
@@ -173,10 +172,9 @@ async def test_dissociate_single_token_successfully(setup_environment):
     params = DissociateTokenParameters(token_ids=[str(token_id_ft)])
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
 
-    assert result.error is None
-    assert exec_result.raw.status == "SUCCESS"
+    assert_executed(result)
+    assert result.raw.status == "SUCCESS"
     assert "successfully dissociated" in result.human_message
 
     # Verify balance is gone (or association removed)
@@ -205,10 +203,9 @@ async def test_dissociate_multiple_tokens_at_once(setup_environment):
     params = DissociateTokenParameters(token_ids=[str(token_id_ft), str(token_id_nft)])
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
 
-    assert result.error is None
-    assert exec_result.raw.status == "SUCCESS"
+    assert_executed(result)
+    assert result.raw.status == "SUCCESS"
     assert "successfully dissociated" in result.human_message
 
     # Verify both removed
@@ -1,42 +1,33 @@
 import pytest
-from hiero_sdk_python import PrivateKey, Hbar
-
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 
 from hedera_agent_kit.plugins.core_evm_query_plugin import (
     GetContractInfoQueryTool,
 )
-from hedera_agent_kit.shared.configuration import Context, AgentMode
 from hedera_agent_kit.shared.parameter_schemas import (
-    CreateAccountParametersNormalised,
     CreateERC20Parameters,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test import HederaOperationsWrapper, poll_until_visible
 
 
 @pytest.fixture(scope="module")
-async def erc20_contract(operator_client, operator_wrapper):
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Executor account (Agent performing transfers)
-    executor_key = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+async def setup_accounts(operator_client, operator_wrapper, executor_account_pool):
+    # operator_client, operator_wrapper and executor_account_pool are provided by
+    # conftest.py (session scope); the pool deletes the executor at session end
+    executor = await executor_account_pool.acquire()
+
+    yield {
+        "operator_client": operator_client,
+        "executor_client": executor["executor_client"],
+        "executor_account_id": executor["executor_account_id"],
+        "executor_wrapper": executor["executor_wrapper"],
+        "operator_wrapper": operator_wrapper,
+        "context": executor["context"],
+    }
+
+
+@pytest.fixture(scope="module")
+async def erc20_contract(setup_accounts):
+    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
 
     params = CreateERC20Parameters(
         token_name="E2EInfoToken",
@@ -51,48 +42,14 @@ async def erc20_contract(operator_client, operator_wrapper):
     if not erc20_address:
         raise Exception("Failed to create ERC20 for get_contract_info_e2e tests")
 
-    # Wait for mirror node to index the new contract
-    await wait(MIRROR_NODE_WAITING_TIME)
-
-    return erc20_address
-
-
-@pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key_pair.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
+    async def contract_visible() -> bool:
+        await executor_wrapper.mirrornode.get_contract_info(erc20_address)
+        return True
 
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
+    # Resolve as soon as the mirror node has indexed the new contract
+    await poll_until_visible(contract_visible)
 
-    context = Context(
-        mode=AgentMode.AUTONOMOUS,
-        account_id=str(executor_account_id),
-    )
-
-    yield {
-        "operator_client": operator_client,
-        "executor_client": executor_client,
-        "executor_account_id": executor_account_id,
-        "operator_wrapper": operator_wrapper,
-        "context": context,
-    }
-
-    await return_hbars_and_delete_account(
-        HederaOperationsWrapper(executor_client),
-        executor_account_id,
-        operator_client.operator_account_id,
-    )
-    executor_client.close()
+    return erc20_address
 
 
 @pytest.mark.asyncio
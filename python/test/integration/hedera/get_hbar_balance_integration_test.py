@@ -6,15 +6,10 @@ fallback, and error handling for non-existent accounts.
 """
 
 import pytest
-from decimal import Decimal
 
-from hiero_sdk_python import Client, PrivateKey, Hbar
-
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
+from hiero_sdk_python import Client, Hbar
 
 from hedera_agent_kit.plugins.core_account_query_plugin import GetHbarBalanceTool
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -23,43 +18,37 @@ from hedera_agent_kit.shared.parameter_schemas import (
     DeleteAccountParametersNormalised,
 )
 from test import HederaOperationsWrapper
-from test.utils import wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test.utils import poll_until_visible
 
+RECIPIENT_BALANCE_TINYBARS = 100_000_000  # Hbar(1)
 
-@pytest.fixture(scope="module")
-async def setup_environment(operator_client, operator_wrapper):
-    """Setup operator and executor clients for balance query tests."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
 
-    # Create an executor account
-    executor_key = PrivateKey.generate_ecdsa()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    # Create recipient account via executor
-    recipient_resp = await executor_wrapper.create_account(
+@pytest.fixture(scope="module")
+async def setup_environment(operator_client, operator_wrapper, executor_account):
+    """Setup the recipient account queried by the balance tests."""
+    # operator_client, operator_wrapper and the shared executor_account are
+    # provided by conftest.py (session scope)
+    executor_client: Client = executor_account["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+    executor_account_id = executor_account["executor_account_id"]
+
+    # Recipient shares the executor key so the executor can delete it at teardown
+    recipient_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
-            key=executor_key.public_key(), initial_balance=Hbar(1)
+            key=executor_account["executor_public_key"],
+            initial_balance=Hbar(1),
         )
     )
     recipient_account_id = recipient_resp.account_id
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def accounts_visible() -> bool:
+        recipient = await executor_wrapper.get_account_info_mirrornode(
+            str(recipient_account_id)
+        )
+        await executor_wrapper.get_account_info_mirrornode(str(executor_account_id))
+        return int(recipient["balance"]["balance"]) == RECIPIENT_BALANCE_TINYBARS
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
+    await poll_until_visible(accounts_visible)
 
     yield {
         "operator_client": operator_client,
@@ -68,24 +57,17 @@ async def setup_environment(operator_client, operator_wrapper):
         "executor_wrapper": executor_wrapper,
         "executor_account_id": executor_account_id,
         "recipient_account_id": recipient_account_id,
-        "context": context,
+        "context": executor_account["context"],
     }
 
-    # Cleanup: delete recipient and executor
+    # Cleanup: delete recipient; the shared executor is deleted at session end
     await executor_wrapper.delete_account(
         DeleteAccountParametersNormalised(
-            account_id=recipient_account_id, transfer_account_id=executor_account_id
-        )
-    )
-    await executor_wrapper.delete_account(
-        DeleteAccountParametersNormalised(
-            account_id=executor_account_id,
+            account_id=recipient_account_id,
             transfer_account_id=operator_client.operator_account_id,
         )
     )
 
-    executor_client.close()
-
 
 @pytest.mark.asyncio
 async def test_get_balance_for_recipient_account(setup_environment):
@@ -103,7 +85,7 @@ async def test_get_balance_for_recipient_account(setup_environment):
     assert not result.error
 
     # Balance should match 1 HBAR
-    assert Decimal(result.extra["balance"]) == Decimal("100000000")
+    assert result.extra["balance_tinybars"] == RECIPIENT_BALANCE_TINYBARS
 
 
 @pytest.mark.asyncio
@@ -115,16 +97,27 @@ async def test_get_balance_default_executor_account(setup_environment):
     context: Context = setup_environment["context"]
 
     params = AccountBalanceQueryParameters()
-    expected_balance = executor_wrapper.get_account_hbar_balance(
+    expected_balance = await executor_wrapper.get_account_hbar_balance(
         str(executor_account_id)
     )
 
+    # The tool reads the mirror node, while the expected balance comes from the
+    # consensus nodes; wait until the mirror node has ingested the executor's
+    # latest transactions so both report the same balance
+    async def mirror_balance_caught_up() -> bool:
+        account = await executor_wrapper.get_account_info_mirrornode(
+            str(executor_account_id)
+        )
+        return int(account["balance"]["balance"]) == expected_balance
+
+    await poll_until_visible(mirror_balance_caught_up)
+
     tool = GetHbarBalanceTool(context)
     result: ToolResponse = await tool.execute(executor_client, context, params)
 
     assert "HBAR Balance" in result.human_message
     assert str(executor_account_id) in result.human_message
-    assert Decimal(result.extra["balance"]) == expected_balance
+    assert result.extra["balance_tinybars"] == expected_balance
 
 
 @pytest.mark.asyncio
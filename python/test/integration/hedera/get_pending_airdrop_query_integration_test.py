@@ -4,18 +4,17 @@ This test verifies pending airdrop querying via Hedera mirror node using
 the Hedera Agent Kit. It covers successful airdrop retrieval and error handling.
 """
 
+import asyncio
+
 import pytest
-from hiero_sdk_python import Client, PrivateKey, Hbar, SupplyType
+from hiero_sdk_python import Client, Hbar, SupplyType
 
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 from hiero_sdk_python.tokens.token_create_transaction import TokenParams, TokenKeys
 from hiero_sdk_python.tokens.token_transfer import TokenTransfer
 
 from hedera_agent_kit.plugins.core_token_query_plugin.get_pending_airdrop_query import (
     GetPendingAirdropQueryTool,
 )
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -27,32 +26,19 @@ from hedera_agent_kit.shared.parameter_schemas.token_schema import (
     PendingAirdropQueryParameters,
 )
 from test import HederaOperationsWrapper
-from test.utils import wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test.utils import poll_until_visible
 from test.utils.teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_environment(operator_client, operator_wrapper):
-    """Setup operator and executor clients for pending airdrop query tests."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Create an executor account
-    executor_key = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+async def setup_environment(operator_client, operator_wrapper, executor_account):
+    """Setup the token and airdrop recipient for pending airdrop query tests."""
+    # operator_client, operator_wrapper and the shared executor_account are
+    # provided by conftest.py (session scope)
+    executor_client: Client = executor_account["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+    executor_account_id = executor_account["executor_account_id"]
+    executor_public_key = executor_account["executor_public_key"]
 
     # Create FT
     ft_params = TokenParams(
@@ -66,24 +52,27 @@ async def setup_environment(operator_client, operator_wrapper):
         auto_renew_account_id=executor_account_id,
     )
     ft_keys = TokenKeys(
-        supply_key=executor_client.operator_private_key.public_key(),
-        admin_key=executor_client.operator_private_key.public_key(),
+        supply_key=executor_public_key,
+        admin_key=executor_public_key,
     )
 
     params_obj = CreateFungibleTokenParametersNormalised(
         token_params=ft_params, keys=ft_keys
     )
-    token_resp = await executor_wrapper.create_fungible_token(params_obj)
-    token_id_ft = token_resp.token_id
 
-    # Create a recipient with 0 auto-associations
-    recipient_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(0),
-            max_automatic_token_associations=0,
-        )
+    # Token creation and the recipient (0 auto-associations) are independent;
+    # only the airdrop below needs both.
+    token_resp, recipient_resp = await asyncio.gather(
+        executor_wrapper.create_fungible_token(params_obj),
+        operator_wrapper.create_account(
+            CreateAccountParametersNormalised(
+                key=executor_public_key,
+                initial_balance=Hbar(0),
+                max_automatic_token_associations=0,
+            )
+        ),
     )
+    token_id_ft = token_resp.token_id
     recipient_id = recipient_resp.account_id
 
     airdrop_params = AirdropFungibleTokenParametersNormalised(
@@ -98,9 +87,11 @@ async def setup_environment(operator_client, operator_wrapper):
     # Airdrop tokens
     await executor_wrapper.airdrop_token(airdrop_params)
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def airdrop_visible() -> bool:
+        pending = await executor_wrapper.get_pending_airdrops(str(recipient_id))
+        return len(pending.get("airdrops", [])) > 0
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
+    await poll_until_visible(airdrop_visible)
 
     yield {
         "operator_client": operator_client,
@@ -110,22 +101,16 @@ async def setup_environment(operator_client, operator_wrapper):
         "executor_account_id": executor_account_id,
         "recipient_id": recipient_id,
         "token_id_ft": token_id_ft,
-        "context": context,
+        "context": executor_account["context"],
     }
 
-    # Cleanup
+    # Cleanup: the shared executor is the token treasury; the executor pool
+    # deletes the token together with the executor at session end
     await return_hbars_and_delete_account(
         account_wrapper=executor_wrapper,
         account_to_delete=recipient_id,
         account_to_return=operator_client.operator_account_id,
     )
-    await return_hbars_and_delete_account(
-        account_wrapper=executor_wrapper,
-        account_to_delete=executor_account_id,
-        account_to_return=operator_client.operator_account_id,
-    )
-
-    executor_client.close()
 
 
 @pytest.mark.asyncio
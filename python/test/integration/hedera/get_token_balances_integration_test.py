@@ -6,52 +6,34 @@ fallback, and error handling.
 """
 
 import pytest
+from hiero_sdk_python import Client
 
-from hiero_sdk_python import Client, PrivateKey, Hbar
-
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 from hiero_sdk_python.tokens.token_create_transaction import TokenParams, TokenKeys
 
 from hedera_agent_kit.plugins.core_account_query_plugin import GetTokenBalancesTool
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
     AccountTokenBalancesQueryParameters,
-    CreateAccountParametersNormalised,
     CreateFungibleTokenParametersNormalised,
 )
 from hedera_agent_kit.shared.parameter_schemas.token_schema import (
     TransferFungibleTokenParametersNormalised,
 )
 from test import HederaOperationsWrapper
-from test.utils import wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils.teardown import return_hbars_and_delete_account
+from test.utils import poll_until_visible
 
 
 @pytest.fixture(scope="module")
-async def setup_environment(operator_client, operator_wrapper):
-    """Setup operator and executor clients for token balance query tests."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Create an executor account
-    executor_key = PrivateKey.generate_ecdsa()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+async def setup_environment(operator_client, operator_wrapper, executor_account):
+    """Setup the token held by the shared executor for token balance query tests."""
+    # operator_client, operator_wrapper and the shared executor_account are
+    # provided by conftest.py (session scope)
+    executor_client: Client = executor_account["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+    executor_account_id = executor_account["executor_account_id"]
+
+    operator_public_key = operator_client.operator_private_key.public_key()
 
     # Create a fungible token
     token_resp = await operator_wrapper.create_fungible_token(
@@ -64,8 +46,8 @@ async def setup_environment(operator_client, operator_wrapper):
                 treasury_account_id=operator_client.operator_account_id,
             ),
             keys=TokenKeys(
-                admin_key=operator_client.operator_private_key.public_key(),
-                supply_key=operator_client.operator_private_key.public_key(),
+                admin_key=operator_public_key,
+                supply_key=operator_public_key,
             ),
         )
     )
@@ -89,9 +71,13 @@ async def setup_environment(operator_client, operator_wrapper):
         )
     )
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def executor_balance_visible() -> bool:
+        balance = await executor_wrapper.get_account_token_balance(
+            str(executor_account_id), str(token_id)
+        )
+        return balance["balance"] == 50
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
+    await poll_until_visible(executor_balance_visible)
 
     yield {
         "operator_client": operator_client,
@@ -100,16 +86,22 @@ async def setup_environment(operator_client, operator_wrapper):
         "executor_wrapper": executor_wrapper,
         "executor_account_id": executor_account_id,
         "token_id": token_id,
-        "context": context,
+        "context": executor_account["context"],
     }
 
-    # Cleanup: delete executor
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
+    # Cleanup: hand the tokens back so the shared executor can be deleted at
+    # session end (account deletion requires zero token balances)
+    await executor_wrapper.transfer_fungible(
+        TransferFungibleTokenParametersNormalised(
+            ft_transfers={
+                token_id: {
+                    operator_client.operator_account_id: 50,
+                    executor_account_id: -50,
+                }
+            },
+        )
     )
 
-    executor_client.close()
-
 
 @pytest.mark.asyncio
 async def test_get_token_balances_for_account(setup_environment):
@@ -1,75 +1,39 @@
 import pytest
-from hiero_sdk_python import TopicId, PublicKey, PrivateKey, Hbar
+from hiero_sdk_python import TopicId, PublicKey
 
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 
 from hedera_agent_kit.plugins.core_consensus_query_plugin import (
     GetTopicInfoQueryTool,
 )
-from hedera_agent_kit.shared.configuration import Context, AgentMode
 from hedera_agent_kit.shared.parameter_schemas import (
     GetTopicInfoParameters,
     CreateTopicParametersNormalised,
     SubmitTopicMessageParametersNormalised,
-    CreateAccountParametersNormalised,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test import poll_until_visible
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ed25519()
-
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key_pair.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    context = Context(
-        mode=AgentMode.AUTONOMOUS,
-        account_id=str(executor_account_id),
-    )
-
+async def setup_accounts(operator_client, operator_wrapper, executor_account):
+    # operator_client, operator_wrapper and the shared executor_account are
+    # provided by conftest.py (session scope)
     yield {
         "operator_client": operator_client,
-        "executor_client": executor_client,
-        "executor_wrapper": executor_wrapper,
-        "executor_account_id": executor_account_id,
+        "executor_client": executor_account["executor_client"],
+        "executor_wrapper": executor_account["executor_wrapper"],
+        "executor_account_id": executor_account["executor_account_id"],
+        "executor_public_key": executor_account["executor_public_key"],
         "operator_wrapper": operator_wrapper,
-        "context": context,
+        "context": executor_account["context"],
     }
 
-    # Cleanup
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
-    executor_client.close()
-
 
 @pytest.fixture
 async def setup_topic(setup_accounts):
-    executor_client = setup_accounts["executor_client"]
     executor_wrapper = setup_accounts["executor_wrapper"]
 
     # Create a topic with executor as admin
-    topic_admin_key: PublicKey = executor_client.operator_private_key.public_key()
+    topic_admin_key: PublicKey = setup_accounts["executor_public_key"]
     topic_resp = await executor_wrapper.create_topic(
         CreateTopicParametersNormalised(submit_key=topic_admin_key)
     )
@@ -82,7 +46,11 @@ async def setup_topic(setup_accounts):
         )
     )
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def topic_visible() -> bool:
+        await executor_wrapper.mirrornode.get_topic_info(str(created_topic_id))
+        return True
+
+    await poll_until_visible(topic_visible)
 
     yield {
         "created_topic_id": created_topic_id,
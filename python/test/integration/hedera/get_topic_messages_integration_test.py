@@ -4,10 +4,13 @@ This module validates querying topic messages through the tool -> mirror node fl
 testing message fetching, limit handling, and error scenarios.
 """
 
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import List
 
 import pytest
-from hiero_sdk_python import TopicId, PublicKey, PrivateKey, Hbar
+from hiero_sdk_python import AccountId, Client, TopicId, PublicKey
 
 from hedera_agent_kit.plugins.core_consensus_query_plugin import (
     GetTopicMessagesQueryTool,
@@ -17,121 +20,129 @@ from hedera_agent_kit.shared.parameter_schemas import (
     TopicMessagesQueryParameters,
     CreateTopicParametersNormalised,
     SubmitTopicMessageParametersNormalised,
-    CreateAccountParametersNormalised,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_operator_client_for_tests,
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
-from test.utils.usd_to_hbar_service import UsdToHbarService
+from test import HederaOperationsWrapper, poll_until_visible, wait
 
+_UTC = timezone.utc
 
-@pytest.fixture(scope="module")
-async def setup_accounts():
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
 
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ed25519()
+@dataclass(slots=True)
+class TopicTestEnv:
+    """Accounts and clients shared by the tests in this module."""
 
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key_pair.public_key(),
-            initial_balance=Hbar(UsdToHbarService.usd_to_hbar(0.5)),
-        )
-    )
-    executor_account_id = executor_resp.account_id
+    operator_client: Client
+    executor_client: Client
+    executor_wrapper: HederaOperationsWrapper
+    executor_account_id: AccountId
+    executor_public_key: PublicKey
+    operator_wrapper: HederaOperationsWrapper
+    context: Context
 
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
+
+@pytest.fixture(scope="module")
+async def setup_accounts(operator_client, operator_wrapper, executor_account):
+    # operator_client, operator_wrapper and the shared executor_account are
+    # provided by conftest.py (session scope)
+    executor_account_id = executor_account["executor_account_id"]
 
     context = Context(
         mode=AgentMode.AUTONOMOUS,
         account_id=str(executor_account_id),
     )
 
-    yield {
-        "operator_client": operator_client,
-        "executor_client": executor_client,
-        "executor_wrapper": executor_wrapper,
-        "executor_account_id": executor_account_id,
-        "operator_wrapper": operator_wrapper,
-        "context": context,
-    }
-
-    # Cleanup
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
+    yield TopicTestEnv(
+        operator_client=operator_client,
+        executor_client=executor_account["executor_client"],
+        executor_wrapper=executor_account["executor_wrapper"],
+        executor_account_id=executor_account_id,
+        executor_public_key=executor_account["executor_public_key"],
+        operator_wrapper=operator_wrapper,
+        context=context,
     )
-    executor_client.close()
-    operator_client.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def setup_topic_with_messages(setup_accounts):
-    """Create a topic and submit multiple messages to it."""
-    executor_client = setup_accounts["executor_client"]
-    executor_wrapper = setup_accounts["executor_wrapper"]
+    """Create a topic and submit multiple messages to it.
+
+    Module-scoped: the topic is shared by every test that uses this fixture, so
+    those tests must only read from it. Tests that submit messages must create
+    their own topic.
+    """
+    executor_wrapper = setup_accounts.executor_wrapper
 
     # Create a topic with executor as admin
-    topic_admin_key: PublicKey = executor_client.operator_private_key.public_key()
+    topic_admin_key: PublicKey = setup_accounts.executor_public_key
     topic_resp = await executor_wrapper.create_topic(
         CreateTopicParametersNormalised(submit_key=topic_admin_key)
     )
     created_topic_id: TopicId = topic_resp.topic_id
+    created_topic_id_str = str(created_topic_id)
 
-    # Submit three messages to the topic
+    # Submit three messages to the topic. The timestamp filter test needs
+    # messages 1 and 2 in different seconds, so message 1 goes first on its own.
+    # Messages 2 and 3 then go in one batch transaction, which keeps their order.
     await executor_wrapper.submit_message(
         SubmitTopicMessageParametersNormalised(
             topic_id=created_topic_id, message="Message 1"
         )
     )
     await wait(1000)
-    await executor_wrapper.submit_message(
-        SubmitTopicMessageParametersNormalised(
-            topic_id=created_topic_id, message="Message 2"
-        )
-    )
-    await wait(1000)
-    await executor_wrapper.submit_message(
-        SubmitTopicMessageParametersNormalised(
-            topic_id=created_topic_id, message="Message 3"
-        )
+    await executor_wrapper.batch_submit_topic_message(
+        [
+            SubmitTopicMessageParametersNormalised(
+                topic_id=created_topic_id, message=message
+            )
+            for message in ("Message 2", "Message 3")
+        ],
+        batch_key=setup_accounts.executor_client.operator_private_key,
     )
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    # Consensus timestamps (oldest first), captured from the ingestion poll so
+    # tests do not need to re-query the messages to learn them
+    message_timestamps: List[str] = []
+
+    async def messages_visible() -> bool:
+        response = await executor_wrapper.get_topic_messages(created_topic_id_str)
+        if len(response["messages"]) != 3:
+            return False
+        message_timestamps[:] = [
+            m["consensus_timestamp"] for m in reversed(response["messages"])
+        ]
+        return True
+
+    await poll_until_visible(messages_visible)
 
     yield {
         "created_topic_id": created_topic_id,
+        "created_topic_id_str": created_topic_id_str,
         "topic_admin_key": topic_admin_key,
+        "message_timestamps": message_timestamps,
     }
 
 
 @pytest.mark.asyncio
 async def test_fetch_all_topic_messages(setup_accounts, setup_topic_with_messages):
     """Should fetch all topic messages."""
-    executor_client = setup_accounts["executor_client"]
-    context = setup_accounts["context"]
-    created_topic_id = setup_topic_with_messages["created_topic_id"]
+    executor_client = setup_accounts.executor_client
+    context = setup_accounts.context
+    created_topic_id_str: str = setup_topic_with_messages["created_topic_id_str"]
 
     tool = GetTopicMessagesQueryTool(context)
     result = await tool.execute(
         executor_client,
         context,
-        TopicMessagesQueryParameters(topic_id=str(created_topic_id)),
+        TopicMessagesQueryParameters(topic_id=created_topic_id_str),
     )
 
     assert result.error is None
     assert result.extra is not None
-    assert result.extra["topicId"] == str(created_topic_id)
+    assert result.extra["topicId"] == created_topic_id_str
     assert len(result.extra["messages"]) == 3
 
-    # Messages are returned in descending order (newest first), reverse for assertion
-    messages_text = [m["message"] for m in reversed(result.extra["messages"])]
-    assert messages_text == ["Message 1", "Message 2", "Message 3"]
+    # Messages are returned in descending order (newest first)
+    messages_text = [m["message"] for m in result.extra["messages"]]
+    assert messages_text == ["Message 3", "Message 2", "Message 1"]
 
     assert "Messages for topic" in result.human_message
     assert "Message 1" in result.human_message
@@ -140,15 +151,15 @@ async def test_fetch_all_topic_messages(setup_accounts, setup_topic_with_message
 @pytest.mark.asyncio
 async def test_fetch_messages_with_limit(setup_accounts, setup_topic_with_messages):
     """Should respect the limit parameter when fetching messages."""
-    executor_client = setup_accounts["executor_client"]
-    context = setup_accounts["context"]
-    created_topic_id = setup_topic_with_messages["created_topic_id"]
+    executor_client = setup_accounts.executor_client
+    context = setup_accounts.context
+    created_topic_id_str: str = setup_topic_with_messages["created_topic_id_str"]
 
     tool = GetTopicMessagesQueryTool(context)
     result = await tool.execute(
         executor_client,
         context,
-        TopicMessagesQueryParameters(topic_id=str(created_topic_id), limit=2),
+        TopicMessagesQueryParameters(topic_id=created_topic_id_str, limit=2),
     )
 
     assert result.error is None
@@ -162,41 +173,25 @@ async def test_fetch_messages_between_specific_timestamps(
     setup_accounts, setup_topic_with_messages
 ):
     """Should fetch messages between specific timestamps."""
-    executor_client = setup_accounts["executor_client"]
-    context = setup_accounts["context"]
-    created_topic_id = setup_topic_with_messages["created_topic_id"]
+    executor_client = setup_accounts.executor_client
+    context = setup_accounts.context
+    created_topic_id_str: str = setup_topic_with_messages["created_topic_id_str"]
 
     tool = GetTopicMessagesQueryTool(context)
 
-    # Fetch all messages first to get timestamps
-    all_messages_result = await tool.execute(
-        executor_client,
-        context,
-        TopicMessagesQueryParameters(topic_id=str(created_topic_id)),
-    )
-
-    assert all_messages_result.error is None
-    assert all_messages_result.extra is not None
-    messages = all_messages_result.extra["messages"]
-    assert len(messages) == 3
-
-    # Get the second message's timestamp (messages are returned in descending order)
-    # Reverse to get oldest first: [Message 1, Message 2, Message 3]
-    ordered_messages = list(reversed(messages))
-    message_2_timestamp = ordered_messages[1]["consensus_timestamp"]
+    # Timestamps are ordered oldest first: [Message 1, Message 2, Message 3]
+    message_2_timestamp = setup_topic_with_messages["message_timestamps"][1]
 
     # Convert consensus_timestamp (e.g., "1234567890.123456789") to ISO format
-    from datetime import datetime, timezone
-
-    timestamp_seconds = int(message_2_timestamp.split(".")[0])
-    start_time = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc).isoformat()
+    timestamp_seconds = int(message_2_timestamp.split(".", 1)[0])
+    start_time = datetime.fromtimestamp(timestamp_seconds, tz=_UTC).isoformat()
 
     # Now query with start_time filter
     result = await tool.execute(
         executor_client,
         context,
         TopicMessagesQueryParameters(
-            topic_id=str(created_topic_id), start_time=start_time
+            topic_id=created_topic_id_str, start_time=start_time
         ),
     )
 
@@ -205,16 +200,16 @@ async def test_fetch_messages_between_specific_timestamps(
     # Should return 2 messages: Message 2 and Message 3
     assert len(result.extra["messages"]) == 2
 
-    # Messages returned in descending order, reverse for assertion
-    messages_text = [m["message"] for m in reversed(result.extra["messages"])]
-    assert messages_text == ["Message 2", "Message 3"]
+    # Messages are returned in descending order (newest first)
+    messages_text = [m["message"] for m in result.extra["messages"]]
+    assert messages_text == ["Message 3", "Message 2"]
 
 
 @pytest.mark.asyncio
 async def test_fail_gracefully_for_nonexistent_topic(setup_accounts):
     """Should fail gracefully for a non-existent topic."""
-    executor_client = setup_accounts["executor_client"]
-    context = setup_accounts["context"]
+    executor_client = setup_accounts.executor_client
+    context = setup_accounts.context
 
     tool = GetTopicMessagesQueryTool(context)
     result = await tool.execute(
@@ -230,18 +225,22 @@ async def test_fail_gracefully_for_nonexistent_topic(setup_accounts):
 @pytest.mark.asyncio
 async def test_empty_topic_returns_no_messages(setup_accounts):
     """Should return no messages for an empty topic."""
-    executor_client = setup_accounts["executor_client"]
-    executor_wrapper = setup_accounts["executor_wrapper"]
-    context = setup_accounts["context"]
+    executor_client = setup_accounts.executor_client
+    executor_wrapper = setup_accounts.executor_wrapper
+    context = setup_accounts.context
 
     # Create a new empty topic
-    topic_admin_key: PublicKey = executor_client.operator_private_key.public_key()
+    topic_admin_key: PublicKey = setup_accounts.executor_public_key
     topic_resp = await executor_wrapper.create_topic(
         CreateTopicParametersNormalised(submit_key=topic_admin_key)
     )
     empty_topic_id: TopicId = topic_resp.topic_id
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def topic_visible() -> bool:
+        await executor_wrapper.mirrornode.get_topic_info(str(empty_topic_id))
+        return True
+
+    await poll_until_visible(topic_visible)
 
     tool = GetTopicMessagesQueryTool(context)
     result = await tool.execute(
@@ -257,31 +256,43 @@ async def test_empty_topic_returns_no_messages(setup_accounts):
 @pytest.mark.asyncio
 async def test_fetch_50_messages(setup_accounts):
     """Should fetch all topic messages from a topic with 5000 messages."""
-    executor_client = setup_accounts["executor_client"]
-    context = setup_accounts["context"]
-    executor_wrapper = setup_accounts["executor_wrapper"]
+    executor_client = setup_accounts.executor_client
+    context = setup_accounts.context
+    executor_wrapper = setup_accounts.executor_wrapper
     topic_id = (
         await executor_wrapper.create_topic(
             CreateTopicParametersNormalised(
-                submit_key=executor_client.operator_private_key.public_key()
+                submit_key=setup_accounts.executor_public_key
             )
         )
     ).topic_id
 
-    print(topic_id)
-
-    for batch in range(4):
-        params: List[SubmitTopicMessageParametersNormalised] = [
+    all_params: List[List[SubmitTopicMessageParametersNormalised]] = [
+        [
             SubmitTopicMessageParametersNormalised(
                 topic_id=topic_id, message=f"Message {index}, Batch {batch}"
             )
             for index in range(25)
         ]
-        await executor_wrapper.batch_submit_topic_message(
-            params, batch_key=executor_client.operator_private_key
+        for batch in range(4)
+    ]
+
+    # The batches are independent writes, so submit them concurrently; each
+    # batch transaction gets its own transaction ID from the SDK
+    await asyncio.gather(
+        *(
+            executor_wrapper.batch_submit_topic_message(
+                batch_params, batch_key=executor_client.operator_private_key
+            )
+            for batch_params in all_params
         )
+    )
+
+    async def messages_visible() -> bool:
+        response = await executor_wrapper.get_topic_messages(str(topic_id))
+        return len(response["messages"]) == 100
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    await poll_until_visible(messages_visible)
 
     tool = GetTopicMessagesQueryTool(context)
     result = await tool.execute(
@@ -1,5 +1,3 @@
-from typing import cast
-
 import pytest
 from hiero_sdk_python import (
     Client,
@@ -17,7 +15,6 @@ from hedera_agent_kit.plugins.core_token_plugin import MintFungibleTokenTool
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -32,6 +29,7 @@ from test.utils.setup import (
     MIRROR_NODE_WAITING_TIME,
 )
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
@@ -108,7 +106,7 @@ async def test_mint_additional_supply(setup_environment):
     token_id: TokenId = setup_environment["token_id"]
 
     # Check supply before
-    token_info_before = executor_wrapper.get_token_info(str(token_id))
+    token_info_before = await executor_wrapper.get_token_info(str(token_id))
     supply_before = token_info_before.total_supply
 
     # Execute Tool
@@ -117,16 +115,15 @@ async def test_mint_additional_supply(setup_environment):
     params = MintFungibleTokenParameters(token_id=str(token_id), amount=5)
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
     # Wait for update
     await wait(MIRROR_NODE_WAITING_TIME)
 
     # Check supply after
-    token_info_after = executor_wrapper.get_token_info(str(token_id))
+    token_info_after = await executor_wrapper.get_token_info(str(token_id))
     supply_after = token_info_after.total_supply
 
-    assert result.error is None
     assert exec_result.raw.status == "SUCCESS"
     assert "Tokens successfully minted" in result.human_message
     # Expected increase: 5 * 10^2 = 500
@@ -149,9 +146,8 @@ async def test_schedule_minting_additional_supply(setup_environment):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert exec_result.raw.status == "SUCCESS"
     assert "Scheduled mint transaction created successfully" in result.human_message
     assert exec_result.raw.transaction_id is not None
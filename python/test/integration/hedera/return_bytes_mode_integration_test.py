@@ -162,7 +162,7 @@ async def test_returned_bytes_can_be_deserialized_and_executed(setup_accounts):
     new_account_id = str(receipt.account_id)
 
     # Verify balance
-    balance = executor_wrapper.get_account_hbar_balance(new_account_id)
+    balance = await executor_wrapper.get_account_hbar_balance(new_account_id)
     assert balance >= int(0.05 * 1e8)  # tinybars
 
     # Verify memo
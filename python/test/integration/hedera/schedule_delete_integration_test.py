@@ -1,103 +1,41 @@
 import time
-from typing import cast
 
 import pytest
 from hiero_sdk_python import (
     Client,
-    PrivateKey,
-    Hbar,
     AccountId,
     Timestamp,
 )
 
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 from hiero_sdk_python.schedule.schedule_create_transaction import ScheduleCreateParams
 
 from hedera_agent_kit.plugins.core_account_plugin.schedule_delete import (
     ScheduleDeleteTool,
 )
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
-    CreateAccountParametersNormalised,
     TransferHbarParametersNormalised,
 )
 from hedera_agent_kit.shared.parameter_schemas.account_schema import (
     ScheduleDeleteTransactionParameters,
 )
+from test.utils.verification import assert_executed
 from test import HederaOperationsWrapper
-from test.utils.setup import get_custom_client
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Setup Executor (who will act as the Schedule Admin)
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    # Setup Recipient (for the underlying transfer in the schedule)
-    recipient_key_pair = PrivateKey.generate_ed25519()
-    recipient_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-            key=recipient_key_pair.public_key(),
-        )
-    )
-    recipient_account_id = recipient_resp.account_id
+def setup_accounts(executor_and_recipient_accounts):
+    """Executor and recipient accounts, shared across the session by conftest.py."""
+    return executor_and_recipient_accounts
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
 
-    yield {
-        "operator_client": operator_client,
-        "operator_wrapper": operator_wrapper,
-        "executor_client": executor_client,
-        "executor_wrapper": executor_wrapper,
-        "executor_account_id": executor_account_id,
-        "recipient_account_id": recipient_account_id,
-        "context": context,
-    }
-
-    # Teardown
-
-    # 1. Cleanup Executor
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
-
-    # 2. Cleanup Recipient
-    # We must use a client authenticated with the recipient's key to delete it/transfer funds out.
-    recipient_client = get_custom_client(recipient_account_id, recipient_key_pair)
-    recipient_cleanup_wrapper = HederaOperationsWrapper(recipient_client)
-
-    await return_hbars_and_delete_account(
-        recipient_cleanup_wrapper,
-        recipient_account_id,
-        operator_client.operator_account_id,
-    )
-
-    recipient_client.close()
-    executor_client.close()
-    operator_client.close()
+@pytest.fixture(scope="module")
+def delete_tool(setup_accounts):
+    """ScheduleDeleteTool bound to the executor context, built once per module."""
+    return ScheduleDeleteTool(setup_accounts["context"])
 
 
 async def create_deletable_scheduled_transaction(
@@ -111,8 +49,10 @@ async def create_deletable_scheduled_transaction(
     allowing it to be deleted later.
     """
 
-    # Calculate expiration time (1 hour from now)
-    future_seconds = int(time.time() + 60 * 60)
+    # Read the clock once: expiration is 1 hour from now, and the memo reuses the
+    # same timestamp to keep each scheduled transaction unique
+    now_ns = time.time_ns()
+    future_seconds = now_ns // 1_000_000_000 + 60 * 60
     expiration = Timestamp(seconds=future_seconds, nanos=0)
 
     # Explicitly set admin_key to the operator's key to allow deletion
@@ -123,7 +63,7 @@ async def create_deletable_scheduled_transaction(
     )
 
     params = TransferHbarParametersNormalised(
-        transaction_memo=f"Test Schedule {time.time()}",
+        transaction_memo=f"Test Schedule {now_ns}",
         scheduling_params=scheduling_params,
         hbar_transfers={
             payer_id: -1,
@@ -144,6 +84,7 @@ async def create_deletable_scheduled_transaction(
 @pytest.mark.asyncio
 async def test_successfully_deletes_scheduled_transaction_before_execution(
     setup_accounts,
+    delete_tool,
 ):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
@@ -160,10 +101,9 @@ async def test_successfully_deletes_scheduled_transaction_before_execution(
     )
 
     # 2. Use the tool to delete it
-    tool = ScheduleDeleteTool(context)
     params = ScheduleDeleteTransactionParameters(schedule_id=schedule_id)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    result: ToolResponse = await delete_tool.execute(executor_client, context, params)
+    exec_result = assert_executed(result)
 
     assert "successfully deleted" in result.human_message
     assert exec_result.raw.transaction_id is not None
@@ -171,28 +111,20 @@ async def test_successfully_deletes_scheduled_transaction_before_execution(
 
 
 @pytest.mark.asyncio
-async def test_delete_fails_with_invalid_schedule_id(setup_accounts):
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
-
-    params = ScheduleDeleteTransactionParameters(schedule_id="0.0.999999")
-    tool = ScheduleDeleteTool(context)
-
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-
-    assert result.error is not None
-    assert "Failed to delete a schedule" in result.human_message
-
-
-@pytest.mark.asyncio
-async def test_delete_fails_with_malformed_schedule_id(setup_accounts):
+@pytest.mark.parametrize(
+    "schedule_id",
+    ["0.0.999999", "invalid-schedule-id"],
+    ids=["non-existent", "malformed"],
+)
+async def test_delete_fails_with_invalid_schedule_id(
+    setup_accounts, delete_tool, schedule_id
+):
     executor_client: Client = setup_accounts["executor_client"]
     context: Context = setup_accounts["context"]
 
-    params = ScheduleDeleteTransactionParameters(schedule_id="invalid-schedule-id")
-    tool = ScheduleDeleteTool(context)
+    params = ScheduleDeleteTransactionParameters(schedule_id=schedule_id)
 
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await delete_tool.execute(executor_client, context, params)
 
     assert result.error is not None
     assert "Failed to delete a schedule" in result.human_message
@@ -5,140 +5,81 @@ verifying that scheduled transactions can be signed correctly.
 """
 
 import time
-from typing import cast
 
 import pytest
 from hiero_sdk_python import (
     Client,
-    PrivateKey,
-    Hbar,
     AccountId,
     Timestamp,
 )
 
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
 from hiero_sdk_python.schedule.schedule_create_transaction import ScheduleCreateParams
 
 from hedera_agent_kit.plugins.core_account_plugin.sign_schedule_transaction import (
     SignScheduleTransactionTool,
 )
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
-    CreateAccountParametersNormalised,
     TransferHbarParametersNormalised,
 )
 from hedera_agent_kit.shared.parameter_schemas.account_schema import (
     SignScheduleTransactionToolParameters,
 )
+from test.utils.verification import assert_executed
 from test import HederaOperationsWrapper
-from test.utils.setup import get_custom_client
-from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
 
 @pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
-    """Setup operator, executor and recipient accounts for tests."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-    # Create executor account (who will sign scheduled transactions)
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    # Create recipient account (for the underlying transfer in the schedule)
-    recipient_key_pair = PrivateKey.generate_ed25519()
-    recipient_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-            key=recipient_key_pair.public_key(),
-        )
-    )
-    recipient_account_id = recipient_resp.account_id
-
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
-
-    yield {
-        "operator_client": operator_client,
-        "operator_wrapper": operator_wrapper,
-        "executor_client": executor_client,
-        "executor_wrapper": executor_wrapper,
-        "executor_account_id": executor_account_id,
-        "recipient_account_id": recipient_account_id,
-        "context": context,
-    }
-
-    # Teardown
-    # Cleanup Executor
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
-    )
+def setup_accounts(executor_and_recipient_accounts):
+    """Executor and recipient accounts, shared across the session by conftest.py."""
+    return executor_and_recipient_accounts
 
-    # Cleanup Recipient
-    recipient_client = get_custom_client(recipient_account_id, recipient_key_pair)
-    recipient_cleanup_wrapper = HederaOperationsWrapper(recipient_client)
 
-    await return_hbars_and_delete_account(
-        recipient_cleanup_wrapper,
-        recipient_account_id,
-        operator_client.operator_account_id,
-    )
-
-    recipient_client.close()
-    executor_client.close()
+@pytest.fixture(scope="module")
+def sign_tool(setup_accounts):
+    """SignScheduleTransactionTool bound to the executor context, built once per module."""
+    return SignScheduleTransactionTool(setup_accounts["context"])
 
 
-async def create_signable_scheduled_transaction(
-    operator_wrapper: HederaOperationsWrapper,
+def _build_schedule_params(
     executor_account_id: AccountId,
     recipient_id: AccountId,
-) -> str:
+    *,
+    wait_for_expiry: bool,
+    memo_prefix: str,
+) -> TransferHbarParametersNormalised:
     """
-    Creates a scheduled transaction that requires signature from executor.
+    Builds a scheduled 1 tinybar transfer from the executor to the recipient.
 
-    The OPERATOR creates the schedule, but the EXECUTOR is the one whose
-    account is being debited. This ensures the executor's signature is
-    required and not already present.
-
-    The schedule is created with wait_for_expiry=True so it won't auto-execute
-    when signed.
+    The scheduled transfer debits the EXECUTOR (not the operator who creates it),
+    so the executor's signature is required and not already present.
     """
-    # Calculate expiration time (1 hour from now)
-    future_seconds = int(time.time() + 60 * 60)
-    expiration = Timestamp(seconds=future_seconds, nanos=0)
-
-    scheduling_params: ScheduleCreateParams = ScheduleCreateParams(
-        expiration_time=expiration,
-        wait_for_expiry=True,  # Won't execute immediately after signing
-    )
-
-    # The scheduled transfer debits the EXECUTOR (not the operator who creates it)
-    # This means the executor's signature is required
-    params = TransferHbarParametersNormalised(
-        transaction_memo=f"Test Schedule Sign {time.time()}",
-        scheduling_params=scheduling_params,
+    # Read the clock once: expiration is 1 hour from now, and the memo reuses the
+    # same timestamp to keep each scheduled transaction unique
+    now_ns = time.time_ns()
+    future_seconds = now_ns // 1_000_000_000 + 60 * 60
+
+    return TransferHbarParametersNormalised(
+        transaction_memo=f"{memo_prefix} {now_ns}",
+        scheduling_params=ScheduleCreateParams(
+            expiration_time=Timestamp(seconds=future_seconds, nanos=0),
+            wait_for_expiry=wait_for_expiry,
+        ),
         hbar_transfers={
             executor_account_id: -1,  # Executor is being debited - needs to sign
             recipient_id: 1,
         },
     )
 
+
+async def _create_scheduled_transfer(
+    operator_wrapper: HederaOperationsWrapper,
+    params: TransferHbarParametersNormalised,
+) -> str:
+    """Submits the scheduled transfer as the OPERATOR and returns its schedule ID."""
     result = await operator_wrapper.transfer_hbar(params)
 
     if not result.schedule_id:
@@ -149,6 +90,32 @@ async def create_signable_scheduled_transaction(
     return str(result.schedule_id)
 
 
+async def create_signable_scheduled_transaction(
+    operator_wrapper: HederaOperationsWrapper,
+    executor_account_id: AccountId,
+    recipient_id: AccountId,
+) -> str:
+    """
+    Creates a scheduled transaction that requires signature from executor.
+
+    The OPERATOR creates the schedule, but the EXECUTOR is the one whose
+    account is being debited. This ensures the executor's signature is
+    required and not already present.
+
+    The schedule is created with wait_for_expiry=True so it won't auto-execute
+    when signed.
+    """
+    return await _create_scheduled_transfer(
+        operator_wrapper,
+        _build_schedule_params(
+            executor_account_id,
+            recipient_id,
+            wait_for_expiry=True,
+            memo_prefix="Test Schedule Sign",
+        ),
+    )
+
+
 async def create_signable_scheduled_transaction_no_wait(
     operator_wrapper: HederaOperationsWrapper,
     executor_account_id: AccountId,
@@ -160,36 +127,19 @@ async def create_signable_scheduled_transaction_no_wait(
 
     The OPERATOR creates the schedule, but the EXECUTOR is debited.
     """
-    # Calculate expiration time (1 hour from now)
-    future_seconds = int(time.time() + 60 * 60)
-    expiration = Timestamp(seconds=future_seconds, nanos=0)
-
-    scheduling_params: ScheduleCreateParams = ScheduleCreateParams(
-        expiration_time=expiration,
-        wait_for_expiry=False,  # Execute immediately when signed
-    )
-
-    params = TransferHbarParametersNormalised(
-        transaction_memo=f"Test Schedule Auto-Execute {time.time()}",
-        scheduling_params=scheduling_params,
-        hbar_transfers={
-            executor_account_id: -1,  # Executor is being debited - needs to sign
-            recipient_id: 1,
-        },
+    return await _create_scheduled_transfer(
+        operator_wrapper,
+        _build_schedule_params(
+            executor_account_id,
+            recipient_id,
+            wait_for_expiry=False,
+            memo_prefix="Test Schedule Auto-Execute",
+        ),
     )
 
-    result = await operator_wrapper.transfer_hbar(params)
-
-    if not result.schedule_id:
-        raise ValueError(
-            "Failed to create scheduled transaction: No Schedule ID returned"
-        )
-
-    return str(result.schedule_id)
-
 
 @pytest.mark.asyncio
-async def test_successfully_signs_scheduled_transaction(setup_accounts):
+async def test_successfully_signs_scheduled_transaction(setup_accounts, sign_tool):
     """Test successfully signing a scheduled transaction."""
     operator_wrapper: HederaOperationsWrapper = setup_accounts["operator_wrapper"]
     executor_client: Client = setup_accounts["executor_client"]
@@ -205,10 +155,9 @@ async def test_successfully_signs_scheduled_transaction(setup_accounts):
     )
 
     # Use the tool to sign it
-    tool = SignScheduleTransactionTool(context)
     params = SignScheduleTransactionToolParameters(schedule_id=schedule_id)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    result: ToolResponse = await sign_tool.execute(executor_client, context, params)
+    exec_result = assert_executed(result)
 
     assert "successfully signed" in result.human_message
     assert "Transaction ID" in result.human_message
@@ -217,52 +166,34 @@ async def test_successfully_signs_scheduled_transaction(setup_accounts):
 
 
 @pytest.mark.asyncio
-async def test_sign_fails_with_invalid_schedule_id(setup_accounts):
-    """Test that signing fails with an invalid schedule ID."""
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
-
-    params = SignScheduleTransactionToolParameters(schedule_id="0.0.999999")
-    tool = SignScheduleTransactionTool(context)
-
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-
-    assert result.error is not None
-    assert "Failed to sign scheduled transaction" in result.human_message
-
-
-@pytest.mark.asyncio
-async def test_sign_fails_with_malformed_schedule_id(setup_accounts):
-    """Test that signing fails with a malformed schedule ID."""
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
-
-    params = SignScheduleTransactionToolParameters(schedule_id="invalid-schedule-id")
-    tool = SignScheduleTransactionTool(context)
-
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-
-    assert result.error is not None
-    assert "Failed to sign scheduled transaction" in result.human_message
-
-
-@pytest.mark.asyncio
-async def test_sign_fails_with_empty_schedule_id(setup_accounts):
-    """Test that signing fails with an empty schedule ID."""
+@pytest.mark.parametrize(
+    "schedule_id",
+    [
+        "0.0.999999",
+        "invalid-schedule-id",
+        "",
+        "0.0.123@#$%",
+        "0.0.123456789012345678901234567890",
+    ],
+    ids=["non-existent", "malformed", "empty", "special-characters", "very-long"],
+)
+async def test_sign_fails_with_invalid_schedule_id(
+    setup_accounts, sign_tool, schedule_id
+):
+    """Test that signing fails with a non-existent or invalid schedule ID."""
     executor_client: Client = setup_accounts["executor_client"]
     context: Context = setup_accounts["context"]
 
-    params = SignScheduleTransactionToolParameters(schedule_id="")
-    tool = SignScheduleTransactionTool(context)
+    params = SignScheduleTransactionToolParameters(schedule_id=schedule_id)
 
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await sign_tool.execute(executor_client, context, params)
 
     assert result.error is not None
     assert "Failed to sign scheduled transaction" in result.human_message
 
 
 @pytest.mark.asyncio
-async def test_sign_fails_when_schedule_already_executed(setup_accounts):
+async def test_sign_fails_when_schedule_already_executed(setup_accounts, sign_tool):
     """Test that signing fails when the schedule has already been executed."""
     operator_wrapper: HederaOperationsWrapper = setup_accounts["operator_wrapper"]
     executor_client: Client = setup_accounts["executor_client"]
@@ -279,44 +210,14 @@ async def test_sign_fails_when_schedule_already_executed(setup_accounts):
     )
 
     # First sign should succeed and execute the transaction
-    tool = SignScheduleTransactionTool(context)
     params = SignScheduleTransactionToolParameters(schedule_id=schedule_id)
-    await tool.execute(executor_client, context, params)
+    await sign_tool.execute(executor_client, context, params)
 
     # This may succeed or fail depending on whether the schedule auto-executes
     # Try to sign again - this should fail as the schedule is already executed
-    second_result: ToolResponse = await tool.execute(executor_client, context, params)
+    second_result: ToolResponse = await sign_tool.execute(
+        executor_client, context, params
+    )
 
     # The second signing attempt should fail as the schedule is already executed
     assert second_result.error is not None or "Failed" in second_result.human_message
-
-
-@pytest.mark.asyncio
-async def test_sign_with_special_characters_in_schedule_id(setup_accounts):
-    """Test that signing fails with special characters in schedule ID."""
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
-
-    params = SignScheduleTransactionToolParameters(schedule_id="0.0.123@#$%")
-    tool = SignScheduleTransactionTool(context)
-
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-
-    assert result.error is not None
-    assert "Failed to sign scheduled transaction" in result.human_message
-
-
-@pytest.mark.asyncio
-async def test_sign_with_very_long_schedule_id(setup_accounts):
-    """Test that signing fails with an overly long schedule ID."""
-    executor_client: Client = setup_accounts["executor_client"]
-    context: Context = setup_accounts["context"]
-
-    long_schedule_id = "0.0.123456789012345678901234567890"
-    params = SignScheduleTransactionToolParameters(schedule_id=long_schedule_id)
-    tool = SignScheduleTransactionTool(context)
-
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-
-    assert result.error is not None
-    assert "Failed to sign scheduled transaction" in result.human_message
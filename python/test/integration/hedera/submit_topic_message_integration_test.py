@@ -1,38 +1,42 @@
-from typing import cast
-
 import pytest
 
 from hedera_agent_kit.plugins.core_consensus_plugin import SubmitTopicMessageTool
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
     SubmitTopicMessageParameters,
     CreateTopicParametersNormalised,
 )
-from test import wait
-from test.utils.setup import MIRROR_NODE_WAITING_TIME
+from test.utils.verification import assert_executed
+from test import poll_until_visible
 
 
-@pytest.fixture(scope="function")
-async def setup_test_topic(operator_client, operator_wrapper):
+@pytest.fixture(scope="module")
+def setup_client(operator_client, operator_wrapper):
     # operator_client and operator_wrapper are provided by conftest.py (session scope)
+    context = Context(
+        mode=AgentMode.AUTONOMOUS,
+        account_id=str(operator_client.operator_account_id),
+    )
+
+    return operator_client, operator_wrapper, context
+
 
-    # create a topic for each test so tests are isolated
+@pytest.fixture(scope="function")
+async def setup_test_topic(setup_client):
+    operator_client, operator_wrapper, context = setup_client
+
+    # create a topic for each test that submits to it, so those tests are isolated;
+    # tests that never touch a real topic use `setup_client` and skip this
     create_params = CreateTopicParametersNormalised(
         submit_key=None,  # No submit key
     )
     created = await operator_wrapper.create_topic(create_params)
     topic_id = str(created.topic_id)
 
-    context = Context(
-        mode=AgentMode.AUTONOMOUS,
-        account_id=str(operator_client.operator_account_id),
-    )
-
     yield operator_client, operator_wrapper, context, topic_id
 
 
@@ -48,11 +52,21 @@ async def test_submit_message_successfully(setup_test_topic):
     )
 
     result: ToolResponse = await tool.execute(operator_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
+
+    # Poll until the mirror node has ingested the message instead of sleeping
+    # for a fixed MIRROR_NODE_WAITING_TIME
+    mirror_node_messages = {"messages": []}
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def message_visible() -> bool:
+        nonlocal mirror_node_messages
+        # One message is enough to prove ingestion, so keep each poll to one row
+        mirror_node_messages = await operator_wrapper.get_topic_messages(
+            topic_id, limit=1
+        )
+        return len(mirror_node_messages["messages"]) != 0
 
-    mirror_node_messages = await operator_wrapper.get_topic_messages(topic_id)
+    await poll_until_visible(message_visible)
 
     assert result is not None
     assert "Message submitted successfully" in result.human_message
@@ -64,8 +78,8 @@ async def test_submit_message_successfully(setup_test_topic):
 
 
 @pytest.mark.asyncio
-async def test_submit_message_invalid_topic_id(setup_test_topic):
-    operator_client, _, context, _ = setup_test_topic
+async def test_submit_message_invalid_topic_id(setup_client):
+    operator_client, _, context = setup_client
 
     tool = SubmitTopicMessageTool(context)
     params = SubmitTopicMessageParameters(
@@ -1,20 +1,18 @@
 """Integration tests for transfer_erc20 tool with Hedera network."""
 
+import asyncio
+import logging
+from typing import Optional
+
 import pytest
-from typing import cast
-from hiero_sdk_python import PrivateKey, Hbar
+from hiero_sdk_python import Client, Hbar, PublicKey
 
 from test.utils.usd_to_hbar_service import UsdToHbarService
 from test.utils.setup.langchain_test_config import BALANCE_TIERS
 
 from hedera_agent_kit.plugins.core_evm_plugin import TransferERC20Tool
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
-from hedera_agent_kit.shared.hedera_utils.mirrornode.types import AccountResponse
-from hedera_agent_kit.shared.models import (
-    ToolResponse,
-    ExecutedTransactionToolResponse,
-)
+from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
     TransferERC20Parameters,
@@ -22,35 +20,28 @@ from hedera_agent_kit.shared.parameter_schemas import (
     SchedulingParams,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils import wait
+from test.utils import poll_until_visible
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture(scope="module")
-async def setup_transfer_erc20(operator_client, operator_wrapper):
-    """Setup test environment with ERC20 token and accounts."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
+RECIPIENT_POOL_SIZE = 3
 
-    # Create an executor account (token creator and sender)
-    executor_key = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
+# The failing transfers are rejected before reaching the recipient, so any
+# existing account will do; 0.0.2 is the network treasury and always exists
+EXISTING_RECIPIENT_ID = "0.0.2"
 
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
+@pytest.fixture(scope="module")
+async def setup_transfer_erc20(operator_client, executor_account):
+    """Setup test environment with ERC20 token and accounts."""
+    # operator_client and the shared executor_account (token creator and sender)
+    # are provided by conftest.py (session scope)
+    executor_client: Client = executor_account["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+    executor_account_id = executor_account["executor_account_id"]
+    context: Context = executor_account["context"]
 
     # Create test ERC20 token with initial supply
     create_params = CreateERC20Parameters(
@@ -67,33 +58,36 @@ async def setup_transfer_erc20(operator_client, operator_wrapper):
 
     test_token_address = create_result["erc20_address"]
 
-    print(f"Test ERC20 token address: {test_token_address}")
+    logger.debug("Test ERC20 token address: %s", test_token_address)
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    async def contract_visible() -> bool:
+        await executor_wrapper.mirrornode.get_contract_info(test_token_address)
+        return True
+
+    await poll_until_visible(contract_visible)
 
     yield {
         "operator_client": operator_client,
         "executor_client": executor_client,
         "executor_wrapper": executor_wrapper,
         "executor_account_id": executor_account_id,
+        "executor_public_key": executor_account["executor_public_key"],
         "context": context,
         "test_token_address": test_token_address,
     }
 
-    # Teardown
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        executor_account_id,
-        operator_client.operator_account_id,
-    )
-    executor_client.close()
 
+async def create_recipient_account(
+    wrapper: HederaOperationsWrapper, public_key: Optional[PublicKey] = None
+):
+    """Helper to create a recipient account.
 
-async def create_recipient_account(wrapper: HederaOperationsWrapper):
-    """Helper to create a recipient account."""
+    Pass `public_key` when the wrapper's operator key is already derived, to skip
+    deriving it again.
+    """
     resp = await wrapper.create_account(
         CreateAccountParametersNormalised(
-            key=wrapper.client.operator_private_key.public_key(),
+            key=public_key or wrapper.client.operator_private_key.public_key(),
             initial_balance=Hbar(
                 UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
             ),
@@ -102,18 +96,90 @@ async def create_recipient_account(wrapper: HederaOperationsWrapper):
     return resp.account_id
 
 
+async def wait_for_accounts(wrapper: HederaOperationsWrapper, account_ids) -> None:
+    """Polls the mirror node until every account in `account_ids` is visible.
+
+    The tool resolves Hedera account IDs through the mirror node, so recipients
+    must be ingested before they are used.
+    """
+
+    async def accounts_visible() -> bool:
+        await asyncio.gather(
+            *(
+                wrapper.get_account_info_mirrornode(str(account_id))
+                for account_id in account_ids
+            )
+        )
+        return True
+
+    await poll_until_visible(accounts_visible)
+
+
+@pytest.fixture(scope="module")
+async def recipient_accounts(setup_transfer_erc20):
+    """Recipient accounts for the transfer tests.
+
+    The recipients are created concurrently up front and handed out with
+    `await take()`, so the mirror node ingestion wait is paid once for all of
+    them instead of once per test. All of them are deleted together at module
+    teardown.
+    """
+    executor_client = setup_transfer_erc20["executor_client"]
+    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
+    executor_public_key = setup_transfer_erc20["executor_public_key"]
+
+    created = list(
+        await asyncio.gather(
+            *(
+                create_recipient_account(executor_wrapper, executor_public_key)
+                for _ in range(RECIPIENT_POOL_SIZE)
+            )
+        )
+    )
+    await wait_for_accounts(executor_wrapper, created)
+    available = list(created)
+
+    async def take():
+        if available:
+            return available.pop()
+        # Pool exhausted (e.g. on reruns): fall back to creating one on demand
+        account_id = await create_recipient_account(
+            executor_wrapper, executor_public_key
+        )
+        created.append(account_id)
+        await wait_for_accounts(executor_wrapper, [account_id])
+        return account_id
+
+    yield take
+
+    await asyncio.gather(
+        *(
+            return_hbars_and_delete_account(
+                executor_wrapper,
+                account_id,
+                executor_client.operator_account_id,
+            )
+            for account_id in created
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def transfer_tool(setup_transfer_erc20):
+    """TransferERC20Tool bound to the executor context, built once per module."""
+    return TransferERC20Tool(setup_transfer_erc20["context"])
+
+
 @pytest.mark.asyncio
-async def test_transfer_tokens_to_hedera_address(setup_transfer_erc20):
+async def test_transfer_tokens_to_hedera_address(
+    setup_transfer_erc20, recipient_accounts, transfer_tool
+):
     """Test transferring ERC20 tokens to a Hedera address."""
     executor_client = setup_transfer_erc20["executor_client"]
-    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
     context = setup_transfer_erc20["context"]
     test_token_address = setup_transfer_erc20["test_token_address"]
 
-    # Create recipient account
-    recipient_account_id = await create_recipient_account(executor_wrapper)
-
-    await wait(MIRROR_NODE_WAITING_TIME)
+    recipient_account_id = await recipient_accounts()
 
     params = TransferERC20Parameters(
         contract_id=test_token_address,
@@ -121,43 +187,27 @@ async def test_transfer_tokens_to_hedera_address(setup_transfer_erc20):
         amount=10,
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
+    exec_result = assert_executed(result)
 
-    assert exec_result.error is None
     assert exec_result.raw.transaction_id is not None
     assert "successfully" in exec_result.human_message.lower()
 
-    # Cleanup recipient
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        recipient_account_id,
-        executor_client.operator_account_id,
-    )
-
 
 @pytest.mark.asyncio
-async def test_transfer_tokens_using_evm_addresses(setup_transfer_erc20):
+async def test_transfer_tokens_using_evm_addresses(
+    setup_transfer_erc20, recipient_accounts, transfer_tool
+):
     """Test transferring ERC20 tokens using EVM addresses."""
     executor_client = setup_transfer_erc20["executor_client"]
-    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
     context = setup_transfer_erc20["context"]
     test_token_address = setup_transfer_erc20["test_token_address"]
 
-    # Create recipient account and get its EVM address
-    recipient_account_id = await create_recipient_account(executor_wrapper)
+    recipient_account_id = await recipient_accounts()
 
-    await wait(MIRROR_NODE_WAITING_TIME)
-
-    # Get EVM address for the recipient
-    recipient_info: AccountResponse = (
-        await executor_wrapper.get_account_info_mirrornode(str(recipient_account_id))
-    )
-    recipient_evm_address = recipient_info.get("evm_address", None)
-    assert (
-        recipient_evm_address is not None
-    ), f"Failed to get EVM address for recipient account {recipient_account_id}"
+    # Recipients are created without an alias, so their EVM address is the
+    # long-zero form of the account ID; no mirror node lookup is needed
+    recipient_evm_address = f"0x{recipient_account_id.to_evm_address()}"
 
     params = TransferERC20Parameters(
         contract_id=test_token_address,
@@ -165,33 +215,22 @@ async def test_transfer_tokens_using_evm_addresses(setup_transfer_erc20):
         amount=5,
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
+    exec_result = assert_executed(result)
 
-    assert exec_result.error is None
     assert exec_result.raw.transaction_id is not None
 
-    # Cleanup recipient
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        recipient_account_id,
-        executor_client.operator_account_id,
-    )
-
 
 @pytest.mark.asyncio
-async def test_schedule_transfer_erc20_tokens(setup_transfer_erc20):
+async def test_schedule_transfer_erc20_tokens(
+    setup_transfer_erc20, recipient_accounts, transfer_tool
+):
     """Test scheduling a transfer of ERC20 tokens."""
     executor_client = setup_transfer_erc20["executor_client"]
-    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
     context = setup_transfer_erc20["context"]
     test_token_address = setup_transfer_erc20["test_token_address"]
 
-    # Create a recipient account
-    recipient_account_id = await create_recipient_account(executor_wrapper)
-
-    await wait(MIRROR_NODE_WAITING_TIME)
+    recipient_account_id = await recipient_accounts()
 
     params = TransferERC20Parameters(
         contract_id=test_token_address,
@@ -200,85 +239,54 @@ async def test_schedule_transfer_erc20_tokens(setup_transfer_erc20):
         scheduling_params=SchedulingParams(is_scheduled=True),
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
+    exec_result = assert_executed(result)
 
-    assert exec_result.error is None
     assert (
         "scheduled transfer of erc20 successfully" in exec_result.human_message.lower()
     )
     assert exec_result.raw.schedule_id is not None
 
-    # Cleanup recipient
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        recipient_account_id,
-        executor_client.operator_account_id,
-    )
-
 
 @pytest.mark.asyncio
-async def test_fail_when_contract_id_invalid(setup_transfer_erc20):
+async def test_fail_when_contract_id_invalid(setup_transfer_erc20, transfer_tool):
     """Test that transfer fails when contractId is invalid."""
     executor_client = setup_transfer_erc20["executor_client"]
-    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
     context = setup_transfer_erc20["context"]
 
-    recipient_account_id = await create_recipient_account(executor_wrapper)
-
     params = TransferERC20Parameters(
         contract_id="invalid-contract-id",
-        recipient_address=str(recipient_account_id),
+        recipient_address=EXISTING_RECIPIENT_ID,
         amount=10,
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
 
     assert result.error is not None
     assert "failed to transfer erc20" in result.human_message.lower()
 
-    # Cleanup recipient
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        recipient_account_id,
-        executor_client.operator_account_id,
-    )
-
 
 @pytest.mark.asyncio
-async def test_fail_when_amount_negative(setup_transfer_erc20):
+async def test_fail_when_amount_negative(setup_transfer_erc20, transfer_tool):
     """Test that transfer fails when amount is negative."""
     executor_client = setup_transfer_erc20["executor_client"]
-    executor_wrapper = setup_transfer_erc20["executor_wrapper"]
     context = setup_transfer_erc20["context"]
     test_token_address = setup_transfer_erc20["test_token_address"]
 
-    recipient_account_id = await create_recipient_account(executor_wrapper)
-
     params = TransferERC20Parameters(
         contract_id=test_token_address,
-        recipient_address=str(recipient_account_id),
+        recipient_address=EXISTING_RECIPIENT_ID,
         amount=-10,
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
 
     assert result.error is not None
     assert "failed to transfer erc20" in result.human_message.lower()
 
-    # Cleanup recipient
-    await return_hbars_and_delete_account(
-        executor_wrapper,
-        recipient_account_id,
-        executor_client.operator_account_id,
-    )
-
 
 @pytest.mark.asyncio
-async def test_fail_when_recipient_address_invalid(setup_transfer_erc20):
+async def test_fail_when_recipient_address_invalid(setup_transfer_erc20, transfer_tool):
     """Test that transfer fails when recipientAddress is invalid."""
     executor_client = setup_transfer_erc20["executor_client"]
     context = setup_transfer_erc20["context"]
@@ -290,8 +298,7 @@ async def test_fail_when_recipient_address_invalid(setup_transfer_erc20):
         amount=10,
     )
 
-    tool = TransferERC20Tool(context)
-    result: ToolResponse = await tool.execute(executor_client, context, params)
+    result: ToolResponse = await transfer_tool.execute(executor_client, context, params)
 
     assert result.error is not None
     assert "failed to transfer erc20" in result.human_message.lower()
@@ -1,19 +1,18 @@
 """Integration tests for transfer_erc721 tool with Hedera network."""
 
+import asyncio
+import logging
+from collections import deque
+
 import pytest
-from typing import cast
-from hiero_sdk_python import PrivateKey, Hbar
+from hiero_sdk_python import Client, Hbar
 
 from test.utils.usd_to_hbar_service import UsdToHbarService
 from test.utils.setup.langchain_test_config import BALANCE_TIERS
 
 from hedera_agent_kit.plugins.core_evm_plugin import TransferERC721Tool
-from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
-from hedera_agent_kit.shared.models import (
-    ToolResponse,
-    ExecutedTransactionToolResponse,
-)
+from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
     TransferERC721Parameters,
@@ -22,38 +21,30 @@ from hedera_agent_kit.shared.parameter_schemas import (
     SchedulingParams,
 )
 from test import HederaOperationsWrapper
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
-from test.utils import wait
+from test.utils import poll_until_visible
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture(scope="module")
-async def setup_transfer_erc721(operator_client, operator_wrapper):
-    """Setup test environment with ERC721 token and accounts."""
-    # operator_client and operator_wrapper are provided by conftest.py (session scope)
+# One per test that transfers a token
+PRE_MINTED_TOKEN_COUNT = 4
 
-    # Create an executor account (token creator and sender)
-    executor_key = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-            ),
-        )
-    )
-    executor_account_id = executor_resp.account_id
 
-    executor_client = get_custom_client(executor_account_id, executor_key)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
-
-    # Create a recipient account
-    recipient_resp = await operator_wrapper.create_account(
+@pytest.fixture(scope="module")
+async def setup_transfer_erc721(operator_client, executor_account):
+    """Setup test environment with ERC721 token and accounts."""
+    # operator_client and the shared executor_account (token creator and sender)
+    # are provided by conftest.py (session scope)
+    executor_client: Client = executor_account["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+    executor_account_id = executor_account["executor_account_id"]
+    context: Context = executor_account["context"]
+
+    # Create a recipient account controlled by the executor's key
+    recipient_resp = await executor_wrapper.create_account(
         CreateAccountParametersNormalised(
-            key=executor_key.public_key(),
+            key=executor_account["executor_public_key"],
             initial_balance=Hbar(
                 UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
             ),
@@ -61,8 +52,6 @@ async def setup_transfer_erc721(operator_client, operator_wrapper):
     )
     recipient_account_id = recipient_resp.account_id
 
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
-
     # Create test ERC721 token
     create_params = CreateERC721Parameters(
         token_name="TestNFT",
@@ -77,9 +66,26 @@ async def setup_transfer_erc721(operator_client, operator_wrapper):
 
     test_token_address = create_result["erc721_address"]
 
-    print(f"Test ERC721 token address: {test_token_address}")
+    logger.debug("Test ERC721 token address: %s", test_token_address)
+
+    async def contract_visible() -> bool:
+        await executor_wrapper.mirrornode.get_contract_info(test_token_address)
+        return True
 
-    await wait(MIRROR_NODE_WAITING_TIME)
+    await poll_until_visible(contract_visible)
+
+    # Mint the tokens the transfer tests hand out up front, concurrently; the
+    # contract numbers them 0..N-1 in whatever order the mints reach consensus
+    mint_params = MintERC721Parameters(
+        contract_id=test_token_address,
+        to_address=str(executor_account_id),
+    )
+    await asyncio.gather(
+        *(
+            executor_wrapper.mint_erc721(mint_params)
+            for _ in range(PRE_MINTED_TOKEN_COUNT)
+        )
+    )
 
     yield {
         "operator_client": operator_client,
@@ -89,45 +95,49 @@ async def setup_transfer_erc721(operator_client, operator_wrapper):
         "recipient_account_id": recipient_account_id,
         "context": context,
         "test_token_address": test_token_address,
-        "next_token_id": 0,
+        "token_ids": deque(range(PRE_MINTED_TOKEN_COUNT)),
+        "next_token_id": PRE_MINTED_TOKEN_COUNT,
     }
 
     # Teardown
     await return_hbars_and_delete_account(
         executor_wrapper,
         recipient_account_id,
-        operator_client.operator_account_id,
-    )
-    await return_hbars_and_delete_account(
-        executor_wrapper,
         executor_account_id,
-        operator_client.operator_account_id,
     )
-    executor_client.close()
 
 
 async def mint_token_for_transfer(setup_env):
-    """Helper to mint a new NFT for transfer tests."""
-    wrapper = setup_env["executor_wrapper"]
-    token_address = setup_env["test_token_address"]
-    executor_account_id = setup_env["executor_account_id"]
-    token_id = setup_env["next_token_id"]
+    """Helper to hand out an NFT owned by the executor for transfer tests.
 
-    mint_params = MintERC721Parameters(
-        contract_id=token_address,
-        to_address=str(executor_account_id),
-    )
+    Returns a pre-minted token ID; once those run out (e.g. on reruns), mints a
+    new one. No mirror node wait is needed: the transfer runs against the
+    contract state on the consensus nodes, which the mint receipt confirms.
+    """
+    if setup_env["token_ids"]:
+        return setup_env["token_ids"].popleft()
 
-    await wrapper.mint_erc721(mint_params)
-    await wait(MIRROR_NODE_WAITING_TIME)
+    token_id = setup_env["next_token_id"]
+    await setup_env["executor_wrapper"].mint_erc721(
+        MintERC721Parameters(
+            contract_id=setup_env["test_token_address"],
+            to_address=str(setup_env["executor_account_id"]),
+        )
+    )
 
     setup_env["next_token_id"] += 1
     return token_id
 
 
+@pytest.fixture(scope="module")
+def transfer_tool(setup_transfer_erc721):
+    """TransferERC721Tool bound to the executor context, built once per module."""
+    return TransferERC721Tool(setup_transfer_erc721["context"])
+
+
 @pytest.mark.asyncio
 async def test_transfer_token_to_another_account_using_hedera_addresses(
-    setup_transfer_erc721,
+    setup_transfer_erc721, transfer_tool
 ):
     """Test transferring ERC721 token using Hedera account IDs."""
     env = setup_transfer_erc721
@@ -140,46 +150,44 @@ async def test_transfer_token_to_another_account_using_hedera_addresses(
         token_id=token_id,
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
     assert exec_result.raw.transaction_id is not None
     assert "ERC721 token transferred successfully" in result.human_message
 
 
 @pytest.mark.asyncio
-async def test_transfer_token_using_evm_addresses(setup_transfer_erc721):
+async def test_transfer_token_using_evm_addresses(setup_transfer_erc721, transfer_tool):
     """Test transferring ERC721 token using EVM addresses."""
     env = setup_transfer_erc721
     token_id = await mint_token_for_transfer(env)
 
-    # Get EVM address for recipient
-    recipient_info = await env["executor_wrapper"].get_account_info_mirrornode(
-        str(env["recipient_account_id"])
-    )
-    recipient_evm_address = recipient_info.get("evm_address")
+    # The recipient is created without an alias, so its EVM address is the
+    # long-zero form of the account ID; no mirror node lookup is needed
+    recipient_evm_address = f"0x{env['recipient_account_id'].to_evm_address()}"
 
     params = TransferERC721Parameters(
         contract_id=env["test_token_address"],
         from_address=str(env["executor_account_id"]),
-        to_address=recipient_evm_address or str(env["recipient_account_id"]),
+        to_address=recipient_evm_address,
         token_id=token_id,
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
     assert exec_result.raw.transaction_id is not None
 
 
 @pytest.mark.asyncio
-async def test_handle_transfer_without_explicit_from_address(setup_transfer_erc721):
+async def test_handle_transfer_without_explicit_from_address(
+    setup_transfer_erc721, transfer_tool
+):
     """Test transferring ERC721 token without explicit fromAddress (defaults to operator)."""
     env = setup_transfer_erc721
     token_id = await mint_token_for_transfer(env)
@@ -190,17 +198,16 @@ async def test_handle_transfer_without_explicit_from_address(setup_transfer_erc7
         token_id=token_id,
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
     assert exec_result.raw.transaction_id is not None
 
 
 @pytest.mark.asyncio
-async def test_schedule_transfer_of_erc721_token(setup_transfer_erc721):
+async def test_schedule_transfer_of_erc721_token(setup_transfer_erc721, transfer_tool):
     """Test scheduling a transfer of ERC721 token."""
     env = setup_transfer_erc721
     token_id = await mint_token_for_transfer(env)
@@ -213,19 +220,18 @@ async def test_schedule_transfer_of_erc721_token(setup_transfer_erc721):
         scheduling_params=SchedulingParams(is_scheduled=True),
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
     assert "Scheduled transfer of ERC721 successfully" in result.human_message
     assert exec_result.raw.schedule_id is not None
     assert exec_result.raw.transaction_id is not None
 
 
 @pytest.mark.asyncio
-async def test_fail_with_invalid_contract_id(setup_transfer_erc721):
+async def test_fail_with_invalid_contract_id(setup_transfer_erc721, transfer_tool):
     """Test that transfer fails with invalid contract ID."""
     env = setup_transfer_erc721
 
@@ -235,8 +241,7 @@ async def test_fail_with_invalid_contract_id(setup_transfer_erc721):
         token_id=1,
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
@@ -244,7 +249,9 @@ async def test_fail_with_invalid_contract_id(setup_transfer_erc721):
 
 
 @pytest.mark.asyncio
-async def test_fail_when_transferring_non_existent_token(setup_transfer_erc721):
+async def test_fail_when_transferring_non_existent_token(
+    setup_transfer_erc721, transfer_tool
+):
     """Test that transfer fails when transferring non-existent token."""
     env = setup_transfer_erc721
 
@@ -255,8 +262,7 @@ async def test_fail_when_transferring_non_existent_token(setup_transfer_erc721):
         token_id=999999,
     )
 
-    tool = TransferERC721Tool(env["context"])
-    result: ToolResponse = await tool.execute(
+    result: ToolResponse = await transfer_tool.execute(
         env["executor_client"], env["context"], params
     )
 
@@ -1,9 +1,9 @@
-from typing import cast
+import asyncio
+import logging
 
 import pytest
 from hiero_sdk_python import (
     Client,
-    PrivateKey,
     Hbar,
     AccountId,
     SupplyType,
@@ -19,7 +19,6 @@ from hedera_agent_kit.plugins.core_token_plugin.transfer_fungible_token_with_all
 )
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
-from hedera_agent_kit.shared.models import ExecutedTransactionToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
     CreateAccountParametersNormalised,
     CreateFungibleTokenParametersNormalised,
@@ -28,12 +27,10 @@ from hedera_agent_kit.shared.parameter_schemas import (
     SchedulingParams,
 )
 from hedera_agent_kit.shared.parameter_schemas.token_schema import TokenTransferEntry
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test import HederaOperationsWrapper, poll_until_visible
+from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 async def create_test_token(
@@ -61,47 +58,35 @@ async def create_test_token(
 @pytest.mark.asyncio
 class TestTransferFungibleTokenWithAllowanceIntegration:
     @pytest.fixture(scope="class")
-    async def setup_accounts(self, operator_client, operator_wrapper):
-        # operator_client and operator_wrapper are provided by conftest.py (session scope)
-
-        # 1. Setup Executor (Token Owner / Treasury)
-        executor_key = PrivateKey.generate_ed25519()
-        executor_resp = await operator_wrapper.create_account(
-            CreateAccountParametersNormalised(
-                key=executor_key.public_key(),
-                initial_balance=Hbar(
-                    UsdToHbarService.usd_to_hbar(BALANCE_TIERS["STANDARD"])
-                ),
-            )
-        )
-        executor_account_id = executor_resp.account_id
-        executor_client = get_custom_client(executor_account_id, executor_key)
-        executor_wrapper = HederaOperationsWrapper(executor_client)
-
-        # 2. Setup Spender Account
-        spender_key = PrivateKey.generate_ed25519()
-        spender_resp = await operator_wrapper.create_account(
-            CreateAccountParametersNormalised(
-                key=spender_key.public_key(),
-                initial_balance=Hbar(
-                    UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-                ),
+    async def setup_accounts(self, operator_client, executor_account, key_pool):
+        # operator_client, the shared executor_account and key_pool are provided by
+        # conftest.py (session scope)
+
+        # 1. Executor (Token Owner / Treasury)
+        executor_client: Client = executor_account["executor_client"]
+        executor_wrapper: HederaOperationsWrapper = executor_account["executor_wrapper"]
+        executor_account_id: AccountId = executor_account["executor_account_id"]
+
+        # 2. Setup Spender and Receiver Accounts (independent, so created concurrently)
+        spender_key = key_pool.take()
+        receiver_key = key_pool.take()
+        spender_resp, receiver_resp = await asyncio.gather(
+            *(
+                executor_wrapper.create_account(
+                    CreateAccountParametersNormalised(
+                        key=key.public_key(),
+                        initial_balance=Hbar(
+                            UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
+                        ),
+                    )
+                )
+                for key in (spender_key, receiver_key)
             )
         )
         spender_account_id = spender_resp.account_id
         spender_client = get_custom_client(spender_account_id, spender_key)
         spender_wrapper = HederaOperationsWrapper(spender_client)
 
-        # 3. Setup Receiver Account
-        receiver_key = PrivateKey.generate_ed25519()
-        receiver_resp = await operator_wrapper.create_account(
-            CreateAccountParametersNormalised(
-                key=receiver_key.public_key(),
-                initial_balance=Hbar(
-                    UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-                ),
-            )
-        )
         receiver_account_id = receiver_resp.account_id
         receiver_client = get_custom_client(receiver_account_id, receiver_key)
         receiver_wrapper = HederaOperationsWrapper(receiver_client)
@@ -110,9 +95,7 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
             mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id)
         )
 
-        await wait(MIRROR_NODE_WAITING_TIME)
-
-        # 4. Create Fungible Token
+        # 3. Create Fungible Token
         ft_params = TokenParams(
             token_name="IntegrationAllowanceToken",
             token_symbol="IAT",
@@ -129,26 +112,35 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
             executor_wrapper, executor_client, executor_account_id, ft_params
         )
 
-        # 5. Associate Token to Spender and Receiver
-        await spender_wrapper.associate_token(
-            {"accountId": str(spender_account_id), "tokenId": str(token_id)}
-        )
-        await receiver_wrapper.associate_token(
-            {"accountId": str(receiver_account_id), "tokenId": str(token_id)}
-        )
+        # The tool reads the token's decimals from the mirror node
+        async def token_visible() -> bool:
+            await executor_wrapper.mirrornode.get_token_info(str(token_id))
+            return True
 
-        # 6. Approve Allowance (Executor approves Spender)
-        await executor_wrapper.approve_token_allowance(
-            ApproveTokenAllowanceParametersNormalised(
-                token_allowances=[
-                    TokenAllowance(
-                        token_id=token_id,
-                        owner_account_id=executor_account_id,
-                        spender_account_id=spender_account_id,
-                        amount=200,
-                    )
-                ]
-            )
+        await poll_until_visible(token_visible)
+
+        # 4. Associate Token to Spender and Receiver, and Approve Allowance
+        # (Executor approves Spender). An allowance does not require the spender
+        # to be associated, so all three transactions are submitted concurrently.
+        await asyncio.gather(
+            spender_wrapper.associate_token(
+                {"accountId": str(spender_account_id), "tokenId": str(token_id)}
+            ),
+            receiver_wrapper.associate_token(
+                {"accountId": str(receiver_account_id), "tokenId": str(token_id)}
+            ),
+            executor_wrapper.approve_token_allowance(
+                ApproveTokenAllowanceParametersNormalised(
+                    token_allowances=[
+                        TokenAllowance(
+                            token_id=token_id,
+                            owner_account_id=executor_account_id,
+                            spender_account_id=spender_account_id,
+                            amount=200,
+                        )
+                    ]
+                )
+            ),
         )
 
         yield {
@@ -163,52 +155,54 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
             "receiver_wrapper": receiver_wrapper,
             "receiver_account_id": receiver_account_id,
             "token_id": token_id,
+            # IDs as strings, formatted once for the tool parameters and lookups
+            "executor_account_id_str": str(executor_account_id),
+            "spender_account_id_str": str(spender_account_id),
+            "receiver_account_id_str": str(receiver_account_id),
+            "token_id_str": str(token_id),
             "context": context,
         }
 
-        # Teardown
-        if spender_account_id:
-            await return_hbars_and_delete_account(
+        # Teardown: the executor, and the token it is treasury of, are deleted by
+        # the executor pool at session end. The two deletes are independent, so run them concurrently and let both
+        # finish even if one fails.
+        results = await asyncio.gather(
+            return_hbars_and_delete_account(
                 spender_wrapper, spender_account_id, executor_account_id
-            )
-        spender_client.close()
-
-        if receiver_account_id:
-            await return_hbars_and_delete_account(
+            ),
+            return_hbars_and_delete_account(
                 receiver_wrapper, receiver_account_id, executor_account_id
-            )
-        receiver_client.close()
-
-        if executor_account_id:
-            await return_hbars_and_delete_account(
-                executor_wrapper,
-                executor_account_id,
-                operator_client.operator_account_id,
-            )
-        executor_client.close()
-
-        executor_client.close()
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error("Error cleaning up allowance test account: %s", result)
 
     async def test_transfer_to_self_with_allowance(self, setup_accounts):
         spender_client = setup_accounts["spender_client"]
         spender_wrapper = setup_accounts["spender_wrapper"]
-        spender_account_id = setup_accounts["spender_account_id"]
-        executor_account_id = setup_accounts["executor_account_id"]
-        token_id = setup_accounts["token_id"]
+        spender_account_id_str = setup_accounts["spender_account_id_str"]
+        executor_account_id_str = setup_accounts["executor_account_id_str"]
+        token_id_str = setup_accounts["token_id_str"]
         context = setup_accounts["context"]
 
+        spender_before = await spender_wrapper.get_account_token_balance(
+            spender_account_id_str, token_id_str
+        )
+
         tool = TransferFungibleTokenWithAllowanceTool(context)
 
         params = TransferFungibleTokenWithAllowanceParameters(
-            token_id=str(token_id),
-            source_account_id=str(executor_account_id),
+            token_id=token_id_str,
+            source_account_id=executor_account_id_str,
             transfers=[
-                TokenTransferEntry(account_id=str(spender_account_id), amount=50)
+                TokenTransferEntry(account_id=spender_account_id_str, amount=50)
             ],
         )
 
         result = await tool.execute(spender_client, context, params)
-        exec_result = cast(ExecutedTransactionToolResponse, result)
+        exec_result = assert_executed(result)
 
         assert (
             "Fungible tokens successfully transferred with allowance"
@@ -216,38 +210,52 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
         )
         assert exec_result.raw.status == "SUCCESS"
 
-        await wait(MIRROR_NODE_WAITING_TIME)
+        # Poll until the mirror node reflects the transfer
+        spender_balance = spender_before
 
-        spender_balance = (
-            await spender_wrapper.get_account_token_balance_from_mirrornode(
-                str(spender_account_id), str(token_id)
+        async def spender_credited() -> bool:
+            nonlocal spender_balance
+            spender_balance = await spender_wrapper.get_account_token_balance(
+                spender_account_id_str, token_id_str
             )
-        )
-        assert spender_balance["balance"] == 50
+            return spender_balance["balance"] == spender_before["balance"] + 50
+
+        await poll_until_visible(spender_credited)
+
+        assert spender_balance["balance"] == spender_before["balance"] + 50
 
     async def test_transfer_to_multiple_recipients(self, setup_accounts):
         spender_client = setup_accounts["spender_client"]
         spender_wrapper = setup_accounts["spender_wrapper"]
-        spender_account_id = setup_accounts["spender_account_id"]
+        spender_account_id_str = setup_accounts["spender_account_id_str"]
         receiver_wrapper = setup_accounts["receiver_wrapper"]
-        receiver_account_id = setup_accounts["receiver_account_id"]
-        executor_account_id = setup_accounts["executor_account_id"]
-        token_id = setup_accounts["token_id"]
+        receiver_account_id_str = setup_accounts["receiver_account_id_str"]
+        executor_account_id_str = setup_accounts["executor_account_id_str"]
+        token_id_str = setup_accounts["token_id_str"]
         context = setup_accounts["context"]
 
+        spender_before, receiver_before = await asyncio.gather(
+            spender_wrapper.get_account_token_balance(
+                spender_account_id_str, token_id_str
+            ),
+            receiver_wrapper.get_account_token_balance(
+                receiver_account_id_str, token_id_str
+            ),
+        )
+
         tool = TransferFungibleTokenWithAllowanceTool(context)
 
         params = TransferFungibleTokenWithAllowanceParameters(
-            token_id=str(token_id),
-            source_account_id=str(executor_account_id),
+            token_id=token_id_str,
+            source_account_id=executor_account_id_str,
             transfers=[
-                TokenTransferEntry(account_id=str(spender_account_id), amount=30),
-                TokenTransferEntry(account_id=str(receiver_account_id), amount=70),
+                TokenTransferEntry(account_id=spender_account_id_str, amount=30),
+                TokenTransferEntry(account_id=receiver_account_id_str, amount=70),
             ],
         )
 
         result = await tool.execute(spender_client, context, params)
-        exec_result = cast(ExecutedTransactionToolResponse, result)
+        exec_result = assert_executed(result)
 
         assert (
             "Fungible tokens successfully transferred with allowance"
@@ -255,37 +263,45 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
         )
         assert exec_result.raw.status == "SUCCESS"
 
-        await wait(MIRROR_NODE_WAITING_TIME)
+        # Poll until the mirror node reflects the transfer to both recipients
+        spender_balance, receiver_balance = spender_before, receiver_before
 
-        spender_balance = (
-            await spender_wrapper.get_account_token_balance_from_mirrornode(
-                str(spender_account_id), str(token_id)
+        async def both_credited() -> bool:
+            nonlocal spender_balance, receiver_balance
+            spender_balance, receiver_balance = await asyncio.gather(
+                spender_wrapper.get_account_token_balance(
+                    spender_account_id_str, token_id_str
+                ),
+                receiver_wrapper.get_account_token_balance(
+                    receiver_account_id_str, token_id_str
+                ),
             )
-        )
-        receiver_balance = (
-            await receiver_wrapper.get_account_token_balance_from_mirrornode(
-                str(receiver_account_id), str(token_id)
+            return (
+                spender_balance["balance"] == spender_before["balance"] + 30
+                and receiver_balance["balance"] == receiver_before["balance"] + 70
             )
-        )
 
-        # 50 from the previous test + 30 = 80
-        assert spender_balance["balance"] == 80
-        assert receiver_balance["balance"] == 70
+        await poll_until_visible(both_credited)
+
+        # Compare against the balances read before the transfer, so the result
+        # does not depend on which other tests already ran
+        assert spender_balance["balance"] == spender_before["balance"] + 30
+        assert receiver_balance["balance"] == receiver_before["balance"] + 70
 
     async def test_schedule_transfer_with_allowance(self, setup_accounts):
         spender_client = setup_accounts["spender_client"]
-        spender_account_id = setup_accounts["spender_account_id"]
-        executor_account_id = setup_accounts["executor_account_id"]
-        token_id = setup_accounts["token_id"]
+        spender_account_id_str = setup_accounts["spender_account_id_str"]
+        executor_account_id_str = setup_accounts["executor_account_id_str"]
+        token_id_str = setup_accounts["token_id_str"]
         context = setup_accounts["context"]
 
         tool = TransferFungibleTokenWithAllowanceTool(context)
 
         params = TransferFungibleTokenWithAllowanceParameters(
-            token_id=str(token_id),
-            source_account_id=str(executor_account_id),
+            token_id=token_id_str,
+            source_account_id=executor_account_id_str,
             transfers=[
-                TokenTransferEntry(account_id=str(spender_account_id), amount=10),
+                TokenTransferEntry(account_id=spender_account_id_str, amount=10),
             ],
             scheduling_params=SchedulingParams(
                 is_scheduled=True, wait_for_expiry=False, admin_key=False
@@ -293,7 +309,7 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
         )
 
         result = await tool.execute(spender_client, context, params)
-        exec_result = cast(ExecutedTransactionToolResponse, result)
+        exec_result = assert_executed(result)
 
         assert (
             "Scheduled allowance transfer created successfully" in result.human_message
@@ -302,18 +318,18 @@ class TestTransferFungibleTokenWithAllowanceIntegration:
 
     async def test_fail_exceed_allowance(self, setup_accounts):
         spender_client = setup_accounts["spender_client"]
-        spender_account_id = setup_accounts["spender_account_id"]
-        executor_account_id = setup_accounts["executor_account_id"]
-        token_id = setup_accounts["token_id"]
+        spender_account_id_str = setup_accounts["spender_account_id_str"]
+        executor_account_id_str = setup_accounts["executor_account_id_str"]
+        token_id_str = setup_accounts["token_id_str"]
         context = setup_accounts["context"]
 
         tool = TransferFungibleTokenWithAllowanceTool(context)
 
         params = TransferFungibleTokenWithAllowanceParameters(
-            token_id=str(token_id),
-            source_account_id=str(executor_account_id),
+            token_id=token_id_str,
+            source_account_id=executor_account_id_str,
             transfers=[
-                TokenTransferEntry(account_id=str(spender_account_id), amount=300)
+                TokenTransferEntry(account_id=spender_account_id_str, amount=300)
             ],
         )
 
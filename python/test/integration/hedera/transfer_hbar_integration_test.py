@@ -1,14 +1,11 @@
+import asyncio
+import logging
 from decimal import Decimal
 
 import pytest
-from hiero_sdk_python import PrivateKey, Hbar
-
-from test.utils.usd_to_hbar_service import UsdToHbarService
-from test.utils.setup.langchain_test_config import BALANCE_TIERS
+from hiero_sdk_python import Hbar
 
 from hedera_agent_kit.plugins.core_account_plugin import TransferHbarTool
-from hedera_agent_kit.shared import AgentMode
-from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.hedera_utils import to_tinybars
 from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -16,50 +13,42 @@ from hedera_agent_kit.shared.parameter_schemas import (
     TransferHbarParameters,
     TransferHbarEntry,
 )
-from test import HederaOperationsWrapper
-from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
 
-# Note: operator_client and operator_wrapper fixtures are provided by conftest.py
-#       at session scope for the entire test run.
-
+# Note: operator_client, operator_wrapper and executor_account fixtures are
+#       provided by conftest.py at session scope for the entire test run.
 
-@pytest.fixture(scope="module")
-async def setup_accounts(operator_client, operator_wrapper):
-    """Module-level account setup using session-scoped operator fixtures."""
-    # Create an executor account
-    executor_key_pair = PrivateKey.generate_ed25519()
-    executor_resp = await operator_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(
-                UsdToHbarService.usd_to_hbar(BALANCE_TIERS["MINIMAL"])
-            ),
-            key=executor_key_pair.public_key(),
-        )
-    )
-    executor_account_id = executor_resp.account_id
+# Transfer amounts in HBAR, with the tinybar deltas the assertions expect. The
+# deltas are built from exact decimal strings and computed once per module.
+AMOUNT = 0.1
+AMOUNT_TINYBARS = to_tinybars(Decimal("0.1"))
+SMALL_AMOUNT = 0.05
+SMALL_AMOUNT_TINYBARS = to_tinybars(Decimal("0.05"))
 
-    executor_client = get_custom_client(executor_account_id, executor_key_pair)
-    executor_wrapper = HederaOperationsWrapper(executor_client)
 
-    # Create recipients
-    recipient_resp = await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(0),
-            key=operator_client.operator_private_key.public_key(),
+@pytest.fixture(scope="module")
+async def setup_accounts(operator_client, operator_wrapper, executor_account):
+    """Module-level recipients, sent HBAR by the session-scoped executor account."""
+    executor_client = executor_account["executor_client"]
+    executor_wrapper = executor_account["executor_wrapper"]
+    context = executor_account["context"]
+
+    # Create recipients concurrently; each single-transfer case gets its own
+    recipient_public_key = operator_client.operator_private_key.public_key()
+    recipient_resp, recipient_resp2, recipient_resp3 = await asyncio.gather(
+        *(
+            executor_wrapper.create_account(
+                CreateAccountParametersNormalised(
+                    initial_balance=Hbar(0),
+                    key=recipient_public_key,
+                )
+            )
+            for _ in range(3)
         )
     )
     recipient_account_id = recipient_resp.account_id
-
-    recipient_resp2 = await executor_wrapper.create_account(
-        CreateAccountParametersNormalised(
-            initial_balance=Hbar(0),
-            key=operator_client.operator_private_key.public_key(),
-        )
-    )
     recipient_account_id2 = recipient_resp2.account_id
-
-    context = Context(mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id))
+    recipient_account_id3 = recipient_resp3.account_id
 
     yield {
         "operator_client": operator_client,
@@ -68,44 +57,79 @@ async def setup_accounts(operator_client, operator_wrapper):
         "operator_wrapper": operator_wrapper,
         "recipient_account_id": recipient_account_id,
         "recipient_account_id2": recipient_account_id2,
+        "recipient_account_id3": recipient_account_id3,
         "context": context,
     }
 
-    # Cleanup - only cleanup module resources, operator is managed by conftest.py
-    await return_hbars_and_delete_account(
-        operator_wrapper, recipient_account_id, operator_client.operator_account_id
-    )
-    await return_hbars_and_delete_account(
-        operator_wrapper, recipient_account_id2, operator_client.operator_account_id
-    )
-    await return_hbars_and_delete_account(
-        executor_wrapper, executor_account_id, operator_client.operator_account_id
+    # Cleanup - only cleanup module resources; the operator and executor are
+    # managed by conftest.py. The recipients are deleted concurrently, and a
+    # failure on one does not stop the others.
+    results = await asyncio.gather(
+        *(
+            return_hbars_and_delete_account(
+                operator_wrapper, account_id, operator_client.operator_account_id
+            )
+            for account_id in (
+                recipient_account_id,
+                recipient_account_id2,
+                recipient_account_id3,
+            )
+        ),
+        return_exceptions=True,
     )
-
-    executor_client.close()
+    for result in results:
+        if isinstance(result, Exception):
+            logging.error("Error cleaning up recipient account: %s", result)
 
 
 @pytest.mark.asyncio
-async def test_single_hbar_transfer(setup_accounts):
+@pytest.mark.parametrize(
+    "recipient_key, amount, expected_delta, memo, explicit_source",
+    [
+        (
+            "recipient_account_id",
+            AMOUNT,
+            AMOUNT_TINYBARS,
+            "Integration test transfer",
+            False,
+        ),
+        (
+            "recipient_account_id2",
+            AMOUNT,
+            AMOUNT_TINYBARS,
+            "Explicit source transfer",
+            True,
+        ),
+        ("recipient_account_id3", SMALL_AMOUNT, SMALL_AMOUNT_TINYBARS, None, False),
+    ],
+    ids=["with-memo", "explicit-source", "without-memo"],
+)
+async def test_single_hbar_transfer(
+    setup_accounts, recipient_key, amount, expected_delta, memo, explicit_source
+):
+    """Single-recipient transfer; each case sends to its own recipient."""
     w = setup_accounts["executor_wrapper"]
     executor_client = setup_accounts["executor_client"]
-    recipient = setup_accounts["recipient_account_id"]
+    recipient = setup_accounts[recipient_key]
     context = setup_accounts["context"]
 
-    balance_before = w.get_account_hbar_balance(str(recipient))
-    amount = 0.1
+    balance_before = await w.get_account_hbar_balance(str(recipient))
 
     tool = TransferHbarTool(context)
     params = TransferHbarParameters(
-        transaction_memo="Integration test transfer",
+        transaction_memo=memo,
+        source_account_id=(
+            str(executor_client.operator_account_id) if explicit_source else None
+        ),
         transfers=[
             TransferHbarEntry(account_id=str(recipient), amount=amount)
         ],  # passed in Hbars
     )
-    await tool.execute(executor_client, context, params)
+    result: ToolResponse = await tool.execute(executor_client, context, params)
+    assert result.error is None
 
-    balance_after = w.get_account_hbar_balance(str(recipient))
-    assert balance_after - balance_before == to_tinybars(Decimal(amount))
+    balance_after = await w.get_account_hbar_balance(str(recipient))
+    assert balance_after - balance_before == expected_delta
 
 
 @pytest.mark.asyncio
@@ -116,65 +140,27 @@ async def test_multiple_hbar_transfer(setup_accounts):
     recipient2 = setup_accounts["recipient_account_id2"]
     context = setup_accounts["context"]
 
-    balance_before1 = w.get_account_hbar_balance(str(recipient1))
-    balance_before2 = w.get_account_hbar_balance(str(recipient2))
+    balance_before1, balance_before2 = await asyncio.gather(
+        w.get_account_hbar_balance(str(recipient1)),
+        w.get_account_hbar_balance(str(recipient2)),
+    )
 
     tool = TransferHbarTool(context)
     params = TransferHbarParameters(
         transaction_memo="Multi-recipient transfer",
         transfers=[
-            TransferHbarEntry(account_id=str(recipient1), amount=0.05),
-            TransferHbarEntry(account_id=str(recipient2), amount=0.05),
+            TransferHbarEntry(account_id=str(recipient1), amount=SMALL_AMOUNT),
+            TransferHbarEntry(account_id=str(recipient2), amount=SMALL_AMOUNT),
         ],
     )
     await tool.execute(executor_client, context, params)
 
-    balance_after1 = w.get_account_hbar_balance(str(recipient1))
-    balance_after2 = w.get_account_hbar_balance(str(recipient2))
-    assert balance_after1 - balance_before1 == to_tinybars(Decimal(0.05))
-    assert balance_after2 - balance_before2 == to_tinybars(Decimal(0.05))
-
-
-@pytest.mark.asyncio
-async def test_transfer_with_explicit_source(setup_accounts):
-    w = setup_accounts["executor_wrapper"]
-    executor_client = setup_accounts["executor_client"]
-    recipient = setup_accounts["recipient_account_id"]
-    context = setup_accounts["context"]
-
-    balance_before = w.get_account_hbar_balance(str(recipient))
-    amount = 0.1
-
-    tool = TransferHbarTool(context)
-    params = TransferHbarParameters(
-        transaction_memo="Explicit source transfer",
-        source_account_id=str(executor_client.operator_account_id),
-        transfers=[TransferHbarEntry(account_id=str(recipient), amount=amount)],
-    )
-    await tool.execute(executor_client, context, params)
-
-    balance_after = w.get_account_hbar_balance(str(recipient))
-    assert balance_after - balance_before == to_tinybars(Decimal(amount))
-
-
-@pytest.mark.asyncio
-async def test_transfer_without_memo(setup_accounts):
-    w = setup_accounts["executor_wrapper"]
-    executor_client = setup_accounts["executor_client"]
-    recipient = setup_accounts["recipient_account_id"]
-    context = setup_accounts["context"]
-
-    balance_before = w.get_account_hbar_balance(str(recipient))
-    amount = 0.05
-
-    tool = TransferHbarTool(context)
-    params = TransferHbarParameters(
-        transfers=[TransferHbarEntry(account_id=str(recipient), amount=amount)]
+    balance_after1, balance_after2 = await asyncio.gather(
+        w.get_account_hbar_balance(str(recipient1)),
+        w.get_account_hbar_balance(str(recipient2)),
     )
-    await tool.execute(executor_client, context, params)
-
-    balance_after = w.get_account_hbar_balance(str(recipient))
-    assert balance_after - balance_before == to_tinybars(Decimal(amount))
+    assert balance_after1 - balance_before1 == SMALL_AMOUNT_TINYBARS
+    assert balance_after2 - balance_before2 == SMALL_AMOUNT_TINYBARS
 
 
 @pytest.mark.asyncio
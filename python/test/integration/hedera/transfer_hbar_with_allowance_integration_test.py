@@ -1,5 +1,3 @@
-from typing import cast
-
 import pytest
 from hiero_sdk_python import Client, PrivateKey, Hbar, AccountId
 
@@ -11,10 +9,7 @@ from hedera_agent_kit.plugins.core_account_plugin import (
 )
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
-from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
-    ToolResponse,
-)
+from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas.account_schema import (
     TransferHbarWithAllowanceParameters,
     TransferHbarEntry,
@@ -25,6 +20,7 @@ from hedera_agent_kit.shared.parameter_schemas.account_schema import (
 from test import HederaOperationsWrapper
 from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
@@ -169,15 +165,14 @@ async def test_transfer_hbar_with_allowance_success(setup_accounts):
 
     # Note: Spender client executes the transaction
     result: ToolResponse = await tool.execute(spender_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert "HBAR successfully transferred with allowance" in result.human_message
     assert exec_result.raw.status == "SUCCESS"
 
     # 3. Verify Balances
     # Receiver should have received funds
-    receiver_balance = receiver_wrapper.get_account_hbar_balance(
+    receiver_balance = await receiver_wrapper.get_account_hbar_balance(
         str(receiver_account_id)
     )
     assert receiver_balance == transfer_amount_tinybar
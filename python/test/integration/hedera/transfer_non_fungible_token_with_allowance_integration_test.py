@@ -1,5 +1,3 @@
-from typing import cast
-
 import pytest
 from hiero_sdk_python import (
     Client,
@@ -22,10 +20,7 @@ from hedera_agent_kit.plugins.core_token_plugin.transfer_non_fungible_token_with
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.hedera_utils.mirrornode.types import NftBalanceResponse
-from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
-    ToolResponse,
-)
+from hedera_agent_kit.shared.models import ToolResponse
 from hedera_agent_kit.shared.parameter_schemas.account_schema import (
     CreateAccountParametersNormalised,
 )
@@ -42,6 +37,7 @@ from test.utils.setup import (
     MIRROR_NODE_WAITING_TIME,
 )
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
@@ -197,11 +193,8 @@ async def test_transfer_nft_via_approved_allowance(setup_accounts):
     result: ToolResponse = await tool.execute(spender_client, context, params)
 
     # Safety assertion to debug failures before casting
-    assert result.error is None, f"Tool execution failed: {result.error}"
-
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result is not None
     assert exec_result.raw.status == "SUCCESS"
     assert (
         "Non-fungible tokens successfully transferred with allowance"
@@ -5,9 +5,8 @@ It includes updates to memo, token associations, staking flags, invalid inputs,
 and scheduled transaction execution.
 """
 
-from typing import cast
 import pytest
-from hiero_sdk_python import Client, PrivateKey, Hbar
+from hiero_sdk_python import Client, Hbar
 
 from test.utils.usd_to_hbar_service import UsdToHbarService
 from test.utils.setup.langchain_test_config import BALANCE_TIERS
@@ -17,7 +16,6 @@ from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
     ToolResponse,
-    ExecutedTransactionToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
     UpdateAccountParameters,
@@ -27,6 +25,7 @@ from hedera_agent_kit.shared.parameter_schemas import (
 )
 from test import HederaOperationsWrapper
 from test.utils.setup import get_custom_client
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
@@ -36,13 +35,19 @@ async def setup_operator(operator_client, operator_wrapper):
     yield {"operator_client": operator_client, "operator_wrapper": operator_wrapper}
 
 
-@pytest.fixture
-async def setup_executor(setup_operator):
-    """Create an executor account for each test."""
+@pytest.fixture(scope="module")
+async def setup_executor(setup_operator, key_pool):
+    """Create one executor account shared by the tests in this module.
+
+    The tests only update the executor's memo and staking flag, and none of them
+    depends on the values another test set, so the account does not need to be
+    recreated per test. It is its own account rather than the session-wide
+    `executor_account`, so these updates do not leak into other modules.
+    """
     operator_client: Client = setup_operator["operator_client"]
     operator_wrapper: HederaOperationsWrapper = setup_operator["operator_wrapper"]
 
-    executor_key = PrivateKey.generate_ecdsa()
+    executor_key = key_pool.take_ecdsa()
     executor_resp = await operator_wrapper.create_account(
         CreateAccountParametersNormalised(
             key=executor_key.public_key(),
@@ -89,7 +94,7 @@ async def test_update_account_memo_and_token_associations(setup_executor):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
     assert "Account successfully updated." in result.human_message
     assert exec_result.raw.transaction_id is not None
@@ -115,7 +120,7 @@ async def test_update_account_decline_staking_reward(setup_executor):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
     assert exec_result.raw.transaction_id is not None
 
     info = operator_wrapper.get_account_info(account_id)
@@ -156,7 +161,7 @@ async def test_scheduled_account_update(setup_executor):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
     assert "Scheduled account update created successfully." in result.human_message
     assert "Transaction ID:" in result.human_message
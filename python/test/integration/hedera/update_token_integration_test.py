@@ -3,8 +3,6 @@
 This module tests the UpdateTokenTool directly with real Hedera transactions.
 """
 
-from typing import cast
-
 import pytest
 from hiero_sdk_python import (
     Client,
@@ -21,7 +19,6 @@ from hedera_agent_kit.plugins.core_token_plugin import UpdateTokenTool
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.models import (
-    ExecutedTransactionToolResponse,
     ToolResponse,
 )
 from hedera_agent_kit.shared.parameter_schemas import (
@@ -31,12 +28,10 @@ from hedera_agent_kit.shared.parameter_schemas.token_schema import (
     UpdateTokenParameters,
     CreateFungibleTokenParametersNormalised,
 )
-from test import HederaOperationsWrapper, wait
-from test.utils.setup import (
-    get_custom_client,
-    MIRROR_NODE_WAITING_TIME,
-)
+from test import HederaOperationsWrapper, poll_until_visible
+from test.utils.setup import get_custom_client
 from test.utils.teardown.account_teardown import return_hbars_and_delete_account
+from test.utils.verification import assert_executed
 
 
 @pytest.fixture(scope="module")
@@ -98,18 +93,105 @@ async def create_updatable_token(
     )
 
     resp = await wrapper.create_fungible_token(create_params)
-    await wait(MIRROR_NODE_WAITING_TIME)
+    token_id = str(resp.token_id)
+    await wait_for_token(wrapper, token_id)
+
+    return token_id
+
+
+async def wait_for_token(wrapper: HederaOperationsWrapper, token_id: str) -> None:
+    """Polls until the mirror node has the token; the tool reads its keys there."""
+
+    async def token_visible() -> bool:
+        await wrapper.mirrornode.get_token_info(token_id)
+        return True
+
+    await poll_until_visible(token_visible)
+
+
+@pytest.fixture(scope="module")
+async def updatable_token(setup_accounts):
+    """One updatable token shared by the name, symbol, memo and supply key tests.
+
+    Each of those tests updates a different field and checks only that field,
+    so they can all work on the same token.
+    """
+    return await create_updatable_token(
+        setup_accounts["executor_wrapper"], setup_accounts["executor_client"]
+    )
+
+
+@pytest.fixture(scope="module")
+async def immutable_token(setup_accounts):
+    """A token created without an admin key, so it cannot be updated."""
+    executor_client: Client = setup_accounts["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
+
+    token_params = TokenParams(
+        token_name="ImmutableToken",
+        token_symbol="IMM",
+        decimals=0,
+        initial_supply=100,
+        treasury_account_id=executor_client.operator_account_id,
+        supply_type=SupplyType.FINITE,
+        max_supply=1000,
+        token_type=TokenType.FUNGIBLE_COMMON,
+        auto_renew_account_id=executor_client.operator_account_id,
+    )
+
+    create_params = CreateFungibleTokenParametersNormalised(
+        token_params=token_params,
+        keys=None,  # No admin key - immutable
+    )
+
+    resp = await executor_wrapper.create_fungible_token(create_params)
+    token_id = str(resp.token_id)
+    await wait_for_token(executor_wrapper, token_id)
+
+    return token_id
+
+
+@pytest.fixture(scope="module")
+async def no_freeze_key_token(setup_accounts):
+    """A token created with an admin key only, so it has no freeze key."""
+    executor_client: Client = setup_accounts["executor_client"]
+    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
+
+    admin_key = executor_client.operator_private_key.public_key()
+
+    token_params = TokenParams(
+        token_name="NoFreezeKeyToken",
+        token_symbol="NFK",
+        decimals=0,
+        initial_supply=100,
+        treasury_account_id=executor_client.operator_account_id,
+        supply_type=SupplyType.FINITE,
+        max_supply=1000,
+        token_type=TokenType.FUNGIBLE_COMMON,
+        auto_renew_account_id=executor_client.operator_account_id,
+    )
+
+    token_keys = TokenKeys(admin_key=admin_key)  # Only admin key, no freeze key
+
+    create_params = CreateFungibleTokenParametersNormalised(
+        token_params=token_params,
+        keys=token_keys,
+    )
 
-    return str(resp.token_id)
+    resp = await executor_wrapper.create_fungible_token(create_params)
+    token_id = str(resp.token_id)
+    await wait_for_token(executor_wrapper, token_id)
+
+    return token_id
 
 
 @pytest.mark.asyncio
-async def test_update_token_name(setup_accounts):
+async def test_update_token_name(setup_accounts, updatable_token):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    token_id = await create_updatable_token(executor_wrapper, executor_client)
+    token_id = updatable_token
 
     tool = UpdateTokenTool(context)
     params = UpdateTokenParameters(
@@ -118,24 +200,23 @@ async def test_update_token_name(setup_accounts):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert "Token successfully updated" in result.human_message
     assert exec_result.raw.status == "SUCCESS"
 
     # Verify on-chain state
-    token_info = executor_wrapper.get_token_info(token_id)
+    token_info = await executor_wrapper.get_token_info(token_id)
     assert token_info.name == "NewTokenName"
 
 
 @pytest.mark.asyncio
-async def test_update_token_symbol(setup_accounts):
+async def test_update_token_symbol(setup_accounts, updatable_token):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    token_id = await create_updatable_token(executor_wrapper, executor_client)
+    token_id = updatable_token
 
     tool = UpdateTokenTool(context)
     params = UpdateTokenParameters(
@@ -144,23 +225,22 @@ async def test_update_token_symbol(setup_accounts):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert exec_result.raw.status == "SUCCESS"
 
     # Verify on-chain state
-    token_info = executor_wrapper.get_token_info(token_id)
+    token_info = await executor_wrapper.get_token_info(token_id)
     assert token_info.symbol == "NEWSYM"
 
 
 @pytest.mark.asyncio
-async def test_update_token_memo(setup_accounts):
+async def test_update_token_memo(setup_accounts, updatable_token):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    token_id = await create_updatable_token(executor_wrapper, executor_client)
+    token_id = updatable_token
 
     tool = UpdateTokenTool(context)
     params = UpdateTokenParameters(
@@ -169,23 +249,22 @@ async def test_update_token_memo(setup_accounts):
     )
 
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert exec_result.raw.status == "SUCCESS"
 
     # Verify on-chain state
-    token_info = executor_wrapper.get_token_info(token_id)
+    token_info = await executor_wrapper.get_token_info(token_id)
     assert token_info.memo == "Updated Token Memo"
 
 
 @pytest.mark.asyncio
-async def test_update_supply_key(setup_accounts):
+async def test_update_supply_key(setup_accounts, updatable_token):
     executor_client: Client = setup_accounts["executor_client"]
     executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    token_id = await create_updatable_token(executor_wrapper, executor_client)
+    token_id = updatable_token
 
     # Generate a new key for the supply key
     new_supply_key = PrivateKey.generate_ecdsa().public_key()
@@ -196,51 +275,23 @@ async def test_update_supply_key(setup_accounts):
         supply_key=new_supply_key.to_string(),
     )
 
-    print(token_id)
-
     result: ToolResponse = await tool.execute(executor_client, context, params)
-    exec_result = cast(ExecutedTransactionToolResponse, result)
+    exec_result = assert_executed(result)
 
-    assert result.error is None
     assert exec_result.raw.status == "SUCCESS"
 
-    # Wait for mirror node to sync
-    await wait(MIRROR_NODE_WAITING_TIME)
-
-    # Verify on-chain state
-    token_info = executor_wrapper.get_token_info(token_id)
+    # Verify on-chain state (a consensus node query, so no mirror node wait)
+    token_info = await executor_wrapper.get_token_info(token_id)
     assert token_info.supply_key.to_string() == new_supply_key.to_string()
 
 
 @pytest.mark.asyncio
-async def test_fail_update_immutable_token(setup_accounts):
+async def test_fail_update_immutable_token(setup_accounts, immutable_token):
     """Test updating a token that has no admin key (immutable)."""
     executor_client: Client = setup_accounts["executor_client"]
-    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    # Create immutable token (no admin key)
-    token_params = TokenParams(
-        token_name="ImmutableToken",
-        token_symbol="IMM",
-        decimals=0,
-        initial_supply=100,
-        treasury_account_id=executor_client.operator_account_id,
-        supply_type=SupplyType.FINITE,
-        max_supply=1000,
-        token_type=TokenType.FUNGIBLE_COMMON,
-        auto_renew_account_id=executor_client.operator_account_id,
-    )
-
-    create_params = CreateFungibleTokenParametersNormalised(
-        token_params=token_params,
-        keys=None,  # No admin key - immutable
-    )
-
-    resp = await executor_wrapper.create_fungible_token(create_params)
-    token_id = str(resp.token_id)
-
-    await wait(MIRROR_NODE_WAITING_TIME)
+    token_id = immutable_token
 
     tool = UpdateTokenTool(context)
     params = UpdateTokenParameters(
@@ -277,38 +328,12 @@ async def test_fail_invalid_token_id(setup_accounts):
 
 
 @pytest.mark.asyncio
-async def test_fail_update_key_that_doesnt_exist(setup_accounts):
+async def test_fail_update_key_that_doesnt_exist(setup_accounts, no_freeze_key_token):
     """Test failure when trying to update a key that wasn't set on creation."""
     executor_client: Client = setup_accounts["executor_client"]
-    executor_wrapper: HederaOperationsWrapper = setup_accounts["executor_wrapper"]
     context: Context = setup_accounts["context"]
 
-    # Create token with only admin key (no freeze key)
-    admin_key = executor_client.operator_private_key.public_key()
-
-    token_params = TokenParams(
-        token_name="NoFreezeKeyToken",
-        token_symbol="NFK",
-        decimals=0,
-        initial_supply=100,
-        treasury_account_id=executor_client.operator_account_id,
-        supply_type=SupplyType.FINITE,
-        max_supply=1000,
-        token_type=TokenType.FUNGIBLE_COMMON,
-        auto_renew_account_id=executor_client.operator_account_id,
-    )
-
-    token_keys = TokenKeys(admin_key=admin_key)  # Only admin key, no freeze key
-
-    create_params = CreateFungibleTokenParametersNormalised(
-        token_params=token_params,
-        keys=token_keys,
-    )
-
-    resp = await executor_wrapper.create_fungible_token(create_params)
-    token_id = str(resp.token_id)
-
-    await wait(MIRROR_NODE_WAITING_TIME)
+    token_id = no_freeze_key_token
 
     # Try to update freeze_key which wasn't set
     tool = UpdateTokenTool(context)
@@ -10,7 +10,6 @@ from test.utils.setup.langchain_test_config import (
 from test.utils.general_utils import wait
 from test.utils.setup import get_custom_client
 from test.utils.setup.langchain_test_setup import create_langchain_test_setup
-from test.utils.setup.client_setup import get_operator_client_for_tests
 
 from hedera_agent_kit.shared import AgentMode
 from hedera_agent_kit.hooks.hcs_audit_trail_hook import HcsAuditTrailHook
@@ -35,10 +34,9 @@ from test.utils.hedera_operations_wrapper import HederaOperationsWrapper
 
 
 @pytest.fixture(scope="module")
-async def setup_agent_environment():
+async def setup_agent_environment(operator_client, operator_wrapper):
     """Setup Hedera environment and agent for hook integration tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
+    # operator_client and operator_wrapper are provided by conftest.py (session scope)
 
     # Create an executor account
     executor_key_pair = PrivateKey.generate_ecdsa()
@@ -97,15 +95,12 @@ async def setup_agent_environment():
     }
 
     # Cleanup: Delete the account
-    try:
-        await executor_wrapper.delete_account(
-            DeleteAccountParametersNormalised(
-                account_id=executor_account_id,
-                transfer_account_id=operator_client.operator_account_id,
-            )
+    await executor_wrapper.delete_account(
+        DeleteAccountParametersNormalised(
+            account_id=executor_account_id,
+            transfer_account_id=operator_client.operator_account_id,
         )
-    finally:
-        operator_client.close()
+    )
 
 
 @pytest.mark.asyncio
@@ -41,7 +41,6 @@ from hedera_agent_kit.shared.parameter_schemas import (
 from test.utils.hedera_operations_wrapper import HederaOperationsWrapper
 from test.utils.setup.client_setup import (
     get_custom_client,
-    get_operator_client_for_tests,
 )
 from test.utils.setup.langchain_test_config import BALANCE_TIERS
 from test.utils.usd_to_hbar_service import UsdToHbarService
@@ -94,10 +93,9 @@ def reconstruct_hcs1_content(messages: list[dict]) -> dict:
 
 
 @pytest.fixture(scope="module")
-async def setup_environment():
-    """Create operator + executor accounts for the HOL audit trail integration tests."""
-    operator_client = get_operator_client_for_tests()
-    operator_wrapper = HederaOperationsWrapper(operator_client)
+async def setup_environment(operator_client, operator_wrapper):
+    """Create executor + recipient accounts for the HOL audit trail integration tests."""
+    # operator_client and operator_wrapper are provided by conftest.py (session scope)
 
     executor_key_pair = PrivateKey.generate_ed25519()
     executor_resp = await operator_wrapper.create_account(
@@ -144,7 +142,6 @@ async def setup_environment():
         print(f"Failed to clean up accounts: {e}")
     finally:
         executor_client.close()
-        operator_client.close()
 
 
 # ---------------------------------------------------------------------------
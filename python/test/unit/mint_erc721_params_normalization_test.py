@@ -246,3 +246,27 @@ async def test_invalid_contract_id_raises_value_error():
         await HederaParameterNormaliser.normalise_mint_erc721_params(
             params, mock_context, mock_mirrornode_service, mock_client
         )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        MintERC721Parameters(contract_id="invalid-contract-id"),
+        MintERC721Parameters(contract_id="0.0.abc"),
+        MintERC721Parameters(contract_id="0.0.5005", to_address="0.0."),
+        MintERC721Parameters(contract_id="0.0.5005", to_address="0xdeadbeef"),
+    ],
+)
+async def test_malformed_address_rejected_before_mirrornode_lookup(params):
+    mock_context = Context(account_id="0.0.1001")
+    mock_client = AsyncMock()
+    mock_mirrornode_service = MagicMock()
+    mock_mirrornode_service.get_account = AsyncMock()
+
+    with pytest.raises(ValueError, match="Invalid"):
+        await HederaParameterNormaliser.normalise_mint_erc721_params(
+            params, mock_context, mock_mirrornode_service, mock_client
+        )
+
+    mock_mirrornode_service.get_account.assert_not_called()
@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hedera_agent_kit.shared.hedera_utils.mirrornode import (
+    HederaMirrornodeServiceDefaultImpl,
+)
+from hedera_agent_kit.shared.utils import LedgerId
+
+TOPIC_INFO = {"topic_id": "0.0.1234", "memo": "cached"}
+CACHE_TTL_SECONDS = 0.5
+
+
+def make_service(**kwargs) -> HederaMirrornodeServiceDefaultImpl:
+    kwargs.setdefault("cache_ttl_seconds", CACHE_TTL_SECONDS)
+    return HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_repeated_lookup_within_ttl_is_served_from_cache():
+    service = make_service()
+    service._fetch_json = AsyncMock(return_value=dict(TOPIC_INFO))
+
+    first = await service.get_topic_info("0.0.1234")
+    second = await service.get_topic_info("0.0.1234")
+
+    assert first == second == TOPIC_INFO
+    service._fetch_json.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_not_shared_between_service_instances():
+    first_service = make_service()
+    first_service._fetch_json = AsyncMock(return_value=dict(TOPIC_INFO))
+    second_service = make_service()
+    second_service._fetch_json = AsyncMock(return_value=dict(TOPIC_INFO))
+
+    await first_service.get_topic_info("0.0.1234")
+    await second_service.get_topic_info("0.0.1234")
+
+    second_service._fetch_json.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_not_affected_by_caller_mutation():
+    service = make_service()
+    service._fetch_json = AsyncMock(return_value=dict(TOPIC_INFO))
+
+    first = await service.get_topic_info("0.0.1234")
+    first["memo"] = "mutated"
+    second = await service.get_topic_info("0.0.1234")
+
+    assert second["memo"] == "cached"
+
+
+@pytest.mark.asyncio
+async def test_cache_is_disabled_by_default():
+    service = HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET)
+    service._fetch_json = AsyncMock(return_value=dict(TOPIC_INFO))
+
+    await service.get_topic_info("0.0.1234")
+    await service.get_topic_info("0.0.1234")
+
+    assert service._fetch_json.await_count == 2
+    assert not service._response_cache
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    service = make_service()
+    service._fetch_json = AsyncMock(
+        side_effect=[RuntimeError("HTTP 404"), dict(TOPIC_INFO)]
+    )
+
+    with pytest.raises(RuntimeError):
+        await service.get_topic_info("0.0.1234")
+    result = await service.get_topic_info("0.0.1234")
+
+    assert result == TOPIC_INFO
+    assert service._fetch_json.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request():
+    release = asyncio.Event()
+
+    async def slow_fetch(url, context=None):
+        await release.wait()
+        return dict(TOPIC_INFO)
+
+    service = make_service()
+    service._fetch_json = AsyncMock(side_effect=slow_fetch)
+
+    lookups = asyncio.gather(*(service.get_topic_info("0.0.1234") for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    results = await lookups
+
+    assert all(result == TOPIC_INFO for result in results)
+    service._fetch_json.assert_awaited_once()
+    assert not service._in_flight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookup_failure_reaches_every_caller():
+    release = asyncio.Event()
+
+    async def failing_fetch(url, context=None):
+        await release.wait()
+        raise RuntimeError("HTTP 500")
+
+    service = make_service()
+    service._fetch_json = AsyncMock(side_effect=failing_fetch)
+
+    lookups = asyncio.gather(
+        *(service.get_topic_info("0.0.1234") for _ in range(3)),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0)
+    release.set()
+    results = await lookups
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    service._fetch_json.assert_awaited_once()
+    assert not service._response_cache
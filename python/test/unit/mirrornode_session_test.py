@@ -0,0 +1,52 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hedera_agent_kit.shared.hedera_utils.mirrornode import (
+    HederaMirrornodeServiceDefaultImpl,
+)
+from hedera_agent_kit.shared.utils import LedgerId
+
+URL = "https://testnet.mirrornode.hedera.com/api/v1/topics/0.0.1234"
+
+
+@pytest.fixture
+def service():
+    service = HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET)
+    service._get_json = AsyncMock(return_value={})
+    return service
+
+
+def sessions_used(service):
+    return [call.args[0] for call in service._get_json.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_requests_outside_context_manager_use_their_own_session(service):
+    await service._fetch_json(URL)
+    await service._fetch_json(URL)
+
+    first, second = sessions_used(service)
+    assert first is not second
+    assert first.closed and second.closed
+    assert service._session is None
+
+
+@pytest.mark.asyncio
+async def test_context_manager_reuses_one_session_and_closes_it(service):
+    async with service:
+        await service._fetch_json(URL)
+        await service._fetch_json(URL)
+        pooled = service._session
+
+    first, second = sessions_used(service)
+    assert first is second is pooled
+    assert pooled.closed
+    assert service._session is None
+
+
+@pytest.mark.asyncio
+async def test_close_without_open_session_is_a_no_op(service):
+    await service.close()
+
+    assert service._session is None
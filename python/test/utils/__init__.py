@@ -1,4 +1,4 @@
-from .general_utils import from_evm_address, wait
+from .general_utils import from_evm_address, wait, poll_until_visible
 from .hedera_operations_wrapper import HederaOperationsWrapper
 from .setup.langchain_test_setup import create_langchain_test_setup
 
@@ -7,4 +7,5 @@ __all__ = [
     "HederaOperationsWrapper",
     "create_langchain_test_setup",
     "wait",
+    "poll_until_visible",
 ]
@@ -1,5 +1,11 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
 from hiero_sdk_python.contract.contract_id import ContractId
 
+from .setup.langchain_test_config import MIRROR_NODE_WAITING_TIME
+
 
 def from_evm_address(evm_address: str) -> ContractId:
     """
@@ -46,3 +52,51 @@ async def wait(time_in_millis: int):
     import time
 
     time.sleep(time_in_millis / 1000)
+
+
+async def poll_until_visible(
+    predicate: Callable[[], Awaitable[bool]],
+    max_wait_ms: Optional[int] = None,
+    initial_interval_ms: int = 200,
+    backoff_factor: float = 1.5,
+    raise_on_timeout: bool = True,
+) -> bool:
+    """
+    Polls the mirror node until `predicate` reports the expected state.
+
+    Replaces a fixed `wait(MIRROR_NODE_WAITING_TIME)`: mirror node ingestion is
+    usually much faster than the static budget, so this returns as soon as the
+    entity is visible. Exceptions raised by the predicate (e.g. HTTP 404 while
+    the entity is not yet ingested) are treated as "not visible yet".
+
+    :param predicate: Async callable returning True once the expected data is visible.
+    :param max_wait_ms: Upper bound on total waiting time. Defaults to MIRROR_NODE_WAITING_TIME.
+    :param initial_interval_ms: Delay before the second attempt.
+    :param backoff_factor: Multiplier applied to the delay after every attempt.
+    :param raise_on_timeout: Raise `TimeoutError` (chained to the predicate's last
+        exception, if any) when the budget runs out, instead of returning False.
+    :return: True if the predicate succeeded within the budget, False otherwise.
+    """
+    budget_ms = MIRROR_NODE_WAITING_TIME if max_wait_ms is None else max_wait_ms
+    deadline = time.monotonic() + budget_ms / 1000
+    interval = initial_interval_ms / 1000
+    last_error: Optional[Exception] = None
+
+    while True:
+        try:
+            if await predicate():
+                return True
+            last_error = None
+        except Exception as e:
+            last_error = e
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            if raise_on_timeout:
+                raise TimeoutError(
+                    f"{getattr(predicate, '__name__', 'predicate')} was not "
+                    f"satisfied within {budget_ms} ms"
+                ) from last_error
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        interval *= backoff_factor
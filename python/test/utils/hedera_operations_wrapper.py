@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
 
 from hiero_sdk_python import (
     AccountId,
     AccountInfoQuery,
     Client,
+    CryptoGetAccountBalanceQuery,
     ContractInfoQuery,
     NftId,
     TokenAssociateTransaction,
@@ -34,6 +36,9 @@ from hiero_sdk_python.contract.contract_execute_transaction import (
 
 from hedera_agent_kit.shared.configuration import Context
 from hedera_agent_kit.shared.hedera_utils.hedera_builder import HederaBuilder
+from hedera_agent_kit.shared.hedera_utils.mirrornode import (
+    HederaMirrornodeServiceDefaultImpl,
+)
 from hedera_agent_kit.shared.hedera_utils.mirrornode.hedera_mirrornode_utils import (
     get_mirrornode_service,
 )
@@ -89,16 +94,62 @@ from hedera_agent_kit.shared.constants.contracts import (
 )
 from hiero_sdk_python import ContractCallQuery
 from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.transaction.transaction import Transaction
 from web3 import Web3
 
+# EVM addresses by account ID. An account's EVM address never changes, so it is
+# looked up on the mirror node once per session and shared by all wrappers.
+_evm_address_by_account: Dict[str, str] = {}
+
+
+class _ExecutedTransaction:
+    """Stands in for a transaction that was already executed.
+
+    `execute` returns the receipt obtained beforehand; every other attribute is
+    read from the original transaction.
+    """
+
+    def __init__(self, tx: Transaction, receipt: TransactionReceipt):
+        self._tx = tx
+        self._receipt = receipt
+
+    def execute(self, client: Client) -> TransactionReceipt:
+        return self._receipt
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+
+class _ThreadedExecuteStrategy(ExecuteStrategy):
+    """ExecuteStrategy that submits the transaction from a worker thread.
+
+    The SDK blocks until the receipt is available, so fixtures that gather
+    setup/teardown transactions would otherwise run them one after another on
+    the event loop. Only the blocking `execute` call leaves the loop; the
+    receipt checks and post-processing of the library strategy, which is left
+    unchanged, run on the caller's loop.
+    """
+
+    async def handle(
+        self,
+        tx: Transaction,
+        client: Client,
+        context: Context,
+        post_process: Optional[Callable[[RawTransactionResponse], Any]] = None,
+    ) -> ExecutedTransactionToolResponse:
+        receipt: TransactionReceipt = await asyncio.to_thread(tx.execute, client)
+        return await super().handle(
+            _ExecutedTransaction(tx, receipt), client, context, post_process
+        )
+
 
 class HederaOperationsWrapper:
     """Wrapper around Hedera SDK operations with transaction execution strategies."""
 
     def __init__(self, client: Client):
         self.client = client
-        self.execute_strategy = ExecuteStrategy()
-        self.mirrornode = get_mirrornode_service(None, LedgerId.TESTNET)
+        self.execute_strategy = _ThreadedExecuteStrategy()
+        self.mirrornode = HederaMirrornodeServiceDefaultImpl(LedgerId.TESTNET)
 
     # ---------------------------
     # ACCOUNT OPERATIONS
@@ -218,13 +269,16 @@ class HederaOperationsWrapper:
         )
         return result.raw
 
-    async def get_topic_messages(self, topic_id: str) -> TopicMessagesResponse:
+    async def get_topic_messages(
+        self, topic_id: str, limit: int = 100
+    ) -> TopicMessagesResponse:
+        # Newest first, fetched in as few mirror node pages as `limit` allows
         return await self.mirrornode.get_topic_messages(
             {
                 "topic_id": topic_id,
                 "lowerTimestamp": "",
                 "upperTimestamp": "",
-                "limit": 100,
+                "limit": limit,
             }
         )
 
@@ -298,13 +352,32 @@ class HederaOperationsWrapper:
         account_info: AccountResponse = await self.mirrornode.get_account(account_id)
         return account_info
 
+    async def get_account_evm_address(self, account_id: str) -> str:
+        """Get an account's EVM address, memoized for the session.
+
+        Raises:
+            ValueError: If the mirror node reports no EVM address for the account.
+        """
+        cached = _evm_address_by_account.get(account_id)
+        if cached is not None:
+            return cached
+
+        account_info = await self.get_account_info_mirrornode(account_id)
+        evm_address = account_info.get("evm_address")
+        if not evm_address:
+            raise ValueError(f"Could not get EVM address for account {account_id}")
+
+        _evm_address_by_account[account_id] = evm_address
+        return evm_address
+
     def get_topic_info(self, topic_id: str) -> TopicInfo:
         query = TopicInfoQuery().set_topic_id(TopicId.from_string(topic_id))
         return query.execute(self.client)
 
-    def get_token_info(self, token_id: str) -> TokenInfo:
+    async def get_token_info(self, token_id: str) -> TokenInfo:
+        # The SDK query blocks on the gRPC call, so run it off the event loop
         query = TokenInfoQuery().set_token_id(TokenId.from_string(token_id))
-        return query.execute(self.client)
+        return await asyncio.to_thread(query.execute, self.client)
 
     def get_nft_info(self, token_id: str, serial: int) -> TokenNftInfo:
         query = TokenNftInfoQuery(nft_id=NftId(TokenId.from_string(token_id), serial))
@@ -361,12 +434,19 @@ class HederaOperationsWrapper:
             raise ValueError(f"Token balance for tokenId {token_id} not found")
         return found
 
-    def get_account_hbar_balance(self, account_id: str) -> int:
-        info = self.get_account_info(account_id)
-        balance = getattr(info, "balance", None)
-        if hasattr(balance, "to_tinybars"):
-            return int(balance.to_tinybars())
-        return int(balance or 0)
+    async def get_account_hbar_balance(self, account_id: str) -> int:
+        """Get an account's HBAR balance in tinybars from the consensus nodes.
+
+        Uses the free balance query instead of the paid account info query, and
+        reflects a transaction as soon as its receipt is returned (no mirror node
+        ingestion lag). The SDK query is blocking, so it runs in a worker thread
+        to keep the event loop free for concurrent reads.
+        """
+        query = CryptoGetAccountBalanceQuery(
+            account_id=AccountId.from_string(account_id)
+        )
+        balance: AccountBalance = await asyncio.to_thread(query.execute, self.client)
+        return int(balance.hbars.to_tinybars())
 
     # ---------------------------
     # CONTRACTS / EVM
@@ -571,13 +651,7 @@ class HederaOperationsWrapper:
 
         try:
             # Get EVM address for the account
-            account_info = await self.get_account_info_mirrornode(account_address)
-            account_evm_address = account_info.get("evm_address")
-
-            if not account_evm_address:
-                raise ValueError(
-                    f"Could not get EVM address for account {account_address}"
-                )
+            account_evm_address = await self.get_account_evm_address(account_address)
 
             # Encode the balanceOf function call
             w3 = Web3()
@@ -1,4 +1,12 @@
-from .client_setup import EnvConfig, get_operator_client_for_tests, get_custom_client
+from .client_setup import (
+    EnvConfig,
+    get_operator_client_for_tests,
+    is_operator_configured,
+    get_custom_client,
+    get_worker_operator_client,
+    delete_worker_operator,
+    close_live_clients,
+)
 from .langchain_test_config import (
     LangchainTestOptions,
     DEFAULT_LLM_OPTIONS,
@@ -7,11 +15,17 @@ from .langchain_test_config import (
     get_api_key_for_worker,
 )
 from .llm_factory import LLMProvider, LLMOptions, LLMFactory
+from .key_pool import KeyPool
+from .executor_account_pool import ExecutorAccountPool
 
 __all__ = [
     "EnvConfig",
     "get_operator_client_for_tests",
+    "is_operator_configured",
     "get_custom_client",
+    "get_worker_operator_client",
+    "delete_worker_operator",
+    "close_live_clients",
     "LangchainTestOptions",
     "DEFAULT_LLM_OPTIONS",
     "TOOLKIT_OPTIONS",
@@ -20,4 +34,6 @@ __all__ = [
     "LLMFactory",
     "get_api_key_for_worker",
     "MIRROR_NODE_WAITING_TIME",
+    "KeyPool",
+    "ExecutorAccountPool",
 ]
@@ -1,14 +1,45 @@
+import asyncio
+import logging
 import os
+from typing import Dict, List, Tuple
 
-from hiero_sdk_python import AccountId, PrivateKey, Client, Network
+from hiero_sdk_python import AccountId, Hbar, PrivateKey, Client, Network
 from pydantic import BaseModel, Field, ValidationError
 
+from hedera_agent_kit.shared.hedera_utils.hedera_builder import HederaBuilder
+from hedera_agent_kit.shared.parameter_schemas import (
+    CreateAccountParametersNormalised,
+)
+
 
 class EnvConfig(BaseModel):
     ACCOUNT_ID: str = Field(..., description="Hedera account ID in format 0.0.x")
     PRIVATE_KEY: str = Field(..., description="Private key in DER or string format")
 
 
+# Every client handed out to tests; closed in one batch at session end.
+_live_clients: List[Client] = []
+
+# Clients by (account ID, DER-encoded key), so asking again for the same
+# credentials (e.g. in a fixture's teardown) reuses the client and its channels.
+_clients_by_operator: Dict[Tuple[str, str], Client] = {}
+
+# Minimum retry backoff (seconds) for test clients. The SDK re-polls a pending
+# receipt after min_backoff * 2, * 4, ...; with its 0.25s default the first
+# retries wait 0.5s and 1s. Test-only, not an SDK default.
+TEST_CLIENT_MIN_BACKOFF_SECONDS = 0.1
+
+# Overall timeout (seconds) for one SDK request, retries included. The SDK's
+# 120s default equals the pytest-timeout budget, so a hung request was killed
+# by pytest instead of failing with the SDK's own error.
+TEST_CLIENT_REQUEST_TIMEOUT_SECONDS = 60
+
+
+def is_operator_configured() -> bool:
+    """Whether the operator credentials needed by network tests are set."""
+    return bool(os.getenv("ACCOUNT_ID")) and bool(os.getenv("PRIVATE_KEY"))
+
+
 def get_operator_client_for_tests() -> Client:
     """
     Creates a Hedera client for testing using environment variables.
@@ -47,6 +78,9 @@ def get_custom_client(account_id: AccountId, private_key: PrivateKey) -> Client:
     """
     Creates a Hedera testnet client with custom credentials.
 
+    Clients are memoized per account ID and key for the whole session, so
+    repeated calls with the same credentials return the same client.
+
     Args:
         account_id (AccountId): The account ID to use as an operator.
         private_key (PrivateKey): The private key associated with the account.
@@ -59,7 +93,86 @@ def get_custom_client(account_id: AccountId, private_key: PrivateKey) -> Client:
         >>> tests_private_key = PrivateKey.from_string("302e020100300506032b657004220420...")
         >>> tests_client = get_custom_client(tests_account_id, tests_private_key)
     """
+    cache_key = (str(account_id), private_key.to_string_der())
+    cached = _clients_by_operator.get(cache_key)
+    if cached is not None:
+        return cached
+
     client = Client(Network(network="testnet"))
     client.set_operator(account_id, private_key)
+    client.set_min_backoff(TEST_CLIENT_MIN_BACKOFF_SECONDS)
+    client.set_request_timeout(TEST_CLIENT_REQUEST_TIMEOUT_SECONDS)
+    _live_clients.append(client)
+    _clients_by_operator[cache_key] = client
 
     return client
+
+
+def get_worker_operator_client(
+    operator_client: Client, initial_balance: Hbar
+) -> Client:
+    """
+    Creates a dedicated operator sub-account for the current pytest-xdist worker.
+
+    The sub-account is funded from the main operator, so parallel workers pay for
+    their transactions from separate accounts instead of contending on one payer.
+
+    Args:
+        operator_client (Client): Client for the main operator account.
+        initial_balance (Hbar): Budget transferred to the worker operator.
+
+    Returns:
+        hedera.Client: A testnet client operated by the new sub-account.
+    """
+    worker_key = PrivateKey.generate_ed25519()
+    receipt = HederaBuilder.create_account(
+        CreateAccountParametersNormalised(
+            key=worker_key.public_key(), initial_balance=initial_balance
+        )
+    ).execute(operator_client)
+    if receipt.account_id is None:
+        raise RuntimeError(
+            f"Failed to create worker operator account: {receipt.status}"
+        )
+
+    return get_custom_client(receipt.account_id, worker_key)
+
+
+async def delete_worker_operator(
+    worker_client: Client, transfer_account_id: AccountId
+) -> None:
+    """
+    Deletes a worker operator sub-account, returning its remaining HBAR.
+
+    If the account cannot be deleted (e.g. it is still the treasury of a token a
+    module did not delete), its HBAR is swept back to `transfer_account_id`
+    instead, so the worker's budget is not stranded.
+
+    Best-effort cleanup: failures are logged rather than raised so they do not
+    mask test results at session end.
+    """
+    from test.utils import HederaOperationsWrapper
+    from test.utils.teardown import return_hbars_and_delete_account
+
+    try:
+        await return_hbars_and_delete_account(
+            HederaOperationsWrapper(worker_client),
+            worker_client.operator_account_id,
+            transfer_account_id,
+        )
+    except Exception as e:
+        logging.error("Error deleting worker operator account: %s", e)
+
+
+async def close_live_clients() -> None:
+    """
+    Closes every client created via `get_custom_client` concurrently.
+
+    Each `Client.close()` tears down gRPC channels synchronously, so the closes
+    are dispatched to worker threads instead of running one after another.
+    Closing is idempotent, so clients already closed by a fixture are harmless.
+    """
+    clients = list(_live_clients)
+    _live_clients.clear()
+    _clients_by_operator.clear()
+    await asyncio.gather(*(asyncio.to_thread(client.close) for client in clients))
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Dict, List
+
+from hiero_sdk_python import AccountId, Hbar
+
+from hedera_agent_kit.shared.configuration import AgentMode, Context
+from hedera_agent_kit.shared.parameter_schemas import (
+    CreateAccountParametersNormalised,
+)
+from .client_setup import get_custom_client
+from .key_pool import KeyPool
+
+DEFAULT_EXECUTOR_POOL_SIZE = 2
+
+
+class ExecutorAccountPool:
+    """
+    Pool of funded executor accounts created up front at session start.
+
+    `fill()` creates all accounts concurrently, so modules that acquire an
+    executor do not pay for an AccountCreate round trip in their own setup.
+    Every account handed out (or left unused) is deleted by `close()` at
+    session end. When the pool runs dry a fresh account is created on demand.
+    """
+
+    def __init__(
+        self,
+        operator_wrapper: Any,
+        key_pool: KeyPool,
+        initial_balance: Hbar,
+        size: int = DEFAULT_EXECUTOR_POOL_SIZE,
+    ):
+        self._operator_wrapper = operator_wrapper
+        self._key_pool = key_pool
+        self._initial_balance = initial_balance
+        self._size = size
+        self._available: List[Dict[str, Any]] = []
+        self._created: List[Dict[str, Any]] = []
+
+    async def _create_executor(self) -> Dict[str, Any]:
+        from test import HederaOperationsWrapper
+
+        executor_key = self._key_pool.take()
+        executor_public_key = executor_key.public_key()
+        executor_resp = await self._operator_wrapper.create_account(
+            CreateAccountParametersNormalised(
+                key=executor_public_key, initial_balance=self._initial_balance
+            )
+        )
+        executor_account_id = executor_resp.account_id
+        executor_client = get_custom_client(executor_account_id, executor_key)
+
+        executor = {
+            "executor_client": executor_client,
+            "executor_wrapper": HederaOperationsWrapper(executor_client),
+            "executor_account_id": executor_account_id,
+            "executor_public_key": executor_public_key,
+            "context": Context(
+                mode=AgentMode.AUTONOMOUS, account_id=str(executor_account_id)
+            ),
+        }
+        self._created.append(executor)
+        return executor
+
+    async def fill(self) -> None:
+        """Creates the pooled executor accounts concurrently."""
+        self._available.extend(
+            await asyncio.gather(*(self._create_executor() for _ in range(self._size)))
+        )
+
+    async def acquire(self) -> Dict[str, Any]:
+        """
+        Returns an unused executor account from the pool.
+
+        Returns:
+            dict: `executor_client`, `executor_wrapper`, `executor_account_id`,
+            `executor_public_key` and an AUTONOMOUS `context` for the account.
+        """
+        if self._available:
+            return self._available.pop()
+        return await self._create_executor()
+
+    async def close(self, return_account_id: AccountId) -> None:
+        """
+        Deletes every pooled account concurrently, returning HBAR to `return_account_id`.
+
+        Modules sharing an executor may leave tokens it is treasury of; those are
+        deleted first, since a token treasury cannot be deleted.
+        """
+        from test.utils.teardown import (
+            delete_treasury_tokens,
+            return_hbars_and_delete_account,
+        )
+
+        async def delete_executor(executor: Dict[str, Any]) -> None:
+            await delete_treasury_tokens(
+                executor["executor_wrapper"], executor["executor_account_id"]
+            )
+            await return_hbars_and_delete_account(
+                executor["executor_wrapper"],
+                executor["executor_account_id"],
+                return_account_id,
+            )
+
+        executors = list(self._created)
+        self._created.clear()
+        self._available.clear()
+        await asyncio.gather(*(delete_executor(executor) for executor in executors))
@@ -0,0 +1,42 @@
+from typing import List
+
+from hiero_sdk_python import PrivateKey
+
+DEFAULT_KEY_POOL_SIZE = 32
+
+# Few tests need ECDSA keys (e.g. accounts with an EVM alias), so keep fewer
+DEFAULT_ECDSA_KEY_POOL_SIZE = 4
+
+
+class KeyPool:
+    """
+    Pool of ED25519 and ECDSA keys generated up front for test account creation.
+
+    Keys are generated once per test session (per xdist worker) and handed out
+    exactly once each, so no two accounts ever share a key. When the pool runs
+    dry a fresh key is generated on demand.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_KEY_POOL_SIZE,
+        ecdsa_size: int = DEFAULT_ECDSA_KEY_POOL_SIZE,
+    ):
+        self._keys: List[PrivateKey] = [
+            PrivateKey.generate_ed25519() for _ in range(size)
+        ]
+        self._ecdsa_keys: List[PrivateKey] = [
+            PrivateKey.generate_ecdsa() for _ in range(ecdsa_size)
+        ]
+
+    def take(self) -> PrivateKey:
+        """Returns an unused ED25519 private key from the pool."""
+        if self._keys:
+            return self._keys.pop()
+        return PrivateKey.generate_ed25519()
+
+    def take_ecdsa(self) -> PrivateKey:
+        """Returns an unused ECDSA (secp256k1) private key from the pool."""
+        if self._ecdsa_keys:
+            return self._ecdsa_keys.pop()
+        return PrivateKey.generate_ecdsa()
@@ -1,3 +1,4 @@
 from .account_teardown import return_hbars_and_delete_account
+from .token_teardown import delete_treasury_tokens
 
-__all__ = ["return_hbars_and_delete_account"]
+__all__ = ["return_hbars_and_delete_account", "delete_treasury_tokens"]
@@ -35,7 +35,7 @@ async def return_hbars_and_delete_account(
         )
 
         # Get current HBAR balance in tinybars
-        balance_tinybars: int = account_wrapper.get_account_hbar_balance(
+        balance_tinybars: int = await account_wrapper.get_account_hbar_balance(
             str(account_to_delete)
         )
 
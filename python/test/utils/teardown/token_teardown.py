@@ -0,0 +1,44 @@
+import asyncio
+import logging
+
+from hiero_sdk_python import AccountId, TokenId
+
+from hedera_agent_kit.shared.parameter_schemas import DeleteTokenParametersNormalised
+from .. import HederaOperationsWrapper
+
+
+async def delete_treasury_tokens(
+    account_wrapper: HederaOperationsWrapper,
+    treasury_account_id: AccountId,
+) -> None:
+    """
+    Deletes every token the account is treasury of, so the account itself can be deleted.
+
+    The account's tokens are listed from the mirror node and each one's treasury is
+    checked with a consensus node query. Best-effort cleanup: tokens that cannot be
+    deleted (e.g. created with another admin key) are logged and skipped.
+    """
+    try:
+        token_balances = await account_wrapper.get_account_token_balances(
+            str(treasury_account_id)
+        )
+    except Exception as e:
+        logging.error("Error listing tokens of account %s: %s", treasury_account_id, e)
+        return
+
+    async def delete_if_treasury(token_id: str) -> None:
+        info = await account_wrapper.get_token_info(token_id)
+        if info.is_deleted or str(info.treasury) != str(treasury_account_id):
+            return
+        await account_wrapper.delete_token(
+            DeleteTokenParametersNormalised(token_id=TokenId.from_string(token_id))
+        )
+
+    token_ids = [balance["tokenId"] for balance in token_balances]
+    results = await asyncio.gather(
+        *(delete_if_treasury(token_id) for token_id in token_ids),
+        return_exceptions=True,
+    )
+    for token_id, result in zip(token_ids, results):
+        if isinstance(result, Exception):
+            logging.error("Error deleting treasury token %s: %s", token_id, result)
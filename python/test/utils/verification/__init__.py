@@ -1,4 +1,5 @@
 from .extract_tool_response import extract_tool_response
 from .balance_verification_utils import verify_hbar_balance_change
+from .assert_executed import assert_executed
 
-__all__ = ["verify_hbar_balance_change", "extract_tool_response"]
+__all__ = ["verify_hbar_balance_change", "extract_tool_response", "assert_executed"]
@@ -0,0 +1,19 @@
+from hedera_agent_kit.shared.models import (
+    ExecutedTransactionToolResponse,
+    ToolResponse,
+)
+
+
+def assert_executed(result: ToolResponse) -> ExecutedTransactionToolResponse:
+    """
+    Asserts a tool call executed its transaction and returns the narrowed response.
+
+    Unlike `cast(ExecutedTransactionToolResponse, result)`, an error response
+    fails here with the tool's own message instead of surfacing later as an
+    attribute error on `raw`.
+    """
+    assert result.error is None, result.human_message
+    assert isinstance(
+        result, ExecutedTransactionToolResponse
+    ), f"Expected an executed transaction response, got {type(result).__name__}"
+    return result
@@ -15,7 +15,9 @@ async def verify_hbar_balance_change(
     HBAR has 8 decimal places.
     """
     balance_before = to_display_unit(balance_before_raw, 8)
-    balance_after_raw = hedera_operations_wrapper.get_account_hbar_balance(account_id)
+    balance_after_raw = await hedera_operations_wrapper.get_account_hbar_balance(
+        account_id
+    )
     balance_after = to_display_unit(balance_after_raw, 8)
 
     expected_balance = balance_before + expected_change